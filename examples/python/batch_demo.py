@@ -9,14 +9,150 @@ streams results as they complete.
 
 Use case: Initial font analysis where you need to render thousands of glyphs
 from hundreds of fonts as quickly as possible.
+
+The jobs request ``"format": "metrics"`` because the demo only reads
+metadata: no image is encoded in Rust or shipped across the FFI boundary.
+For large corpora use a metrics-first triage: run metrics mode over
+everything, filter on density/beam, then re-render only the survivors with
+``"format": "pgm"`` when pixels are actually needed.
 """
 
+import io
 import json
+import re
 import sys
 from pathlib import Path
 
 import haforu
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+if orjson is not None:
+
+    def dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    loads = orjson.loads
+else:
+    dumps = json.dumps
+    loads = json.loads
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional speedup
+    ijson = None
+
+
+GLYPHS = ["A", "B", "C"]
+
+# JSON job template: everything except id/path/content is constant, so the
+# spec is written straight to bytes instead of encoding a dict graph.
+# ``path`` and ``content`` must already be JSON-encoded strings.
+JOB_TEMPLATE = (
+    '{{"id":"Arial-Black_{glyph}_1000pt",'
+    '"font":{{"path":{path},"size":1000,"variations":{{}},"face_index":0}},'
+    '"text":{{"content":{content},"script":"Latn","direction":"ltr","language":"en"}},'
+    '"rendering":{{"format":"metrics","encoding":"json","width":3000,"height":1200}}}}'
+)
+
+
+def build_spec(font_path: str, glyphs) -> bytes:
+    """Write a batch job spec for ``glyphs`` directly as JSON bytes."""
+    path = dumps(font_path)
+    jobs = b",".join(
+        JOB_TEMPLATE.format(glyph=glyph, path=path, content=dumps(glyph)).encode()
+        for glyph in glyphs
+    )
+    return b'{"version":"1.0","jobs":[' + jobs + b"]}"
+
+
+# Result fields the demo prints; everything else is skipped while parsing.
+SUMMARY_FIELDS = {
+    "id",
+    "status",
+    "error",
+    "metrics.density",
+    "metrics.beam",
+    "metrics.coverage",
+    "timing.shape_ms",
+    "timing.render_ms",
+    "timing.total_ms",
+}
+
+
+# Fast path for the fixed shape haforu emits for successful metrics jobs:
+# id, status, metrics first and timing last. Anything else (errors, pixel
+# formats, escaped ids) falls back to a real JSON parser.
+_NUM = rb"(-?[0-9.]+(?:[eE][-+]?[0-9]+)?)"
+_METRICS_RESULT_RE = re.compile(
+    rb'\{"id":"([^"\\]*)","status":"success",'
+    rb'"metrics":\{"density":' + _NUM + rb',"beam":' + _NUM + rb',"coverage":' + _NUM + rb","
+    rb'.*"timing":\{"shape_ms":' + _NUM + rb',"render_ms":' + _NUM + rb',"total_ms":' + _NUM
+    + rb"\}\}\s*\Z",
+    re.S,
+)
+_METRICS_RESULT_KEYS = (
+    "metrics.density",
+    "metrics.beam",
+    "metrics.coverage",
+    "timing.shape_ms",
+    "timing.render_ms",
+    "timing.total_ms",
+)
+
+
+def summarize_result(result_line: bytes) -> dict:
+    """Extract the printed fields from a result line.
+
+    With ``ijson`` installed the line is parsed incrementally and the base64
+    ``rendering.data`` blob is only measured, never kept as a Python object.
+    Keys are flattened (``"timing.total_ms"``); ``"rendering.data_len"``
+    holds the payload length.
+
+    Successful metrics results are matched by ``_METRICS_RESULT_RE`` without
+    building any intermediate dict.
+    """
+    match = _METRICS_RESULT_RE.match(result_line)
+    if match is not None:
+        job_id, *numbers = match.groups()
+        summary = dict(zip(_METRICS_RESULT_KEYS, map(float, numbers)))
+        summary["id"] = job_id.decode()
+        summary["status"] = "success"
+        return summary
+
+    if ijson is None:
+        result = loads(result_line)
+        summary = {key: result[key] for key in ("id", "status", "error") if key in result}
+        for section in ("rendering", "metrics", "timing"):
+            for key, value in result.get(section, {}).items():
+                if key == "data":
+                    summary["rendering.data_len"] = len(value)
+                elif f"{section}.{key}" in SUMMARY_FIELDS:
+                    summary[f"{section}.{key}"] = value
+        return summary
+
+    summary = {}
+    for prefix, event, value in ijson.parse(io.BytesIO(result_line)):
+        if prefix == "rendering.data" and event == "string":
+            summary["rendering.data_len"] = len(value)
+        elif prefix in SUMMARY_FIELDS and event in ("string", "number"):
+            summary[prefix] = float(value) if event == "number" else value
+    return summary
+
+
+def iter_result_lines(spec_json: str):
+    """Yield result lines as haforu finishes them, fetched in JSONL chunks.
+
+    process_jobs_buffered() hands over every already-finished result in one
+    ``bytes`` object, so the Rust/Python crossing happens per chunk rather than
+    per job.
+    """
+    for chunk in haforu.process_jobs_buffered(spec_json, batch_size=64):
+        yield from chunk.splitlines()
+
 
 def main():
     """Run batch processing demo."""
@@ -31,119 +167,55 @@ def main():
         sys.exit(1)
 
     # Create a batch job specification
-    # In production, you would generate thousands of these jobs
-    job_spec = {
-        "version": "1.0",
-        "jobs": [
-            {
-                "id": "Arial-Black_A_1000pt",
-                "font": {
-                    "path": str(test_font.absolute()),
-                    "size": 1000,
-                    "variations": {},  # For variable fonts, use {"wght": 600.0}
-                    "face_index": 0
-                },
-                "text": {
-                    "content": "A",
-                    "script": "Latn",
-                    "direction": "ltr",
-                    "language": "en"
-                },
-                "rendering": {
-                    "format": "pgm",
-                    "encoding": "base64",
-                    "width": 3000,
-                    "height": 1200
-                }
-            },
-            {
-                "id": "Arial-Black_B_1000pt",
-                "font": {
-                    "path": str(test_font.absolute()),
-                    "size": 1000,
-                    "variations": {},
-                    "face_index": 0
-                },
-                "text": {
-                    "content": "B",
-                    "script": "Latn",
-                    "direction": "ltr",
-                    "language": "en"
-                },
-                "rendering": {
-                    "format": "pgm",
-                    "encoding": "base64",
-                    "width": 3000,
-                    "height": 1200
-                }
-            },
-            {
-                "id": "Arial-Black_C_1000pt",
-                "font": {
-                    "path": str(test_font.absolute()),
-                    "size": 1000,
-                    "variations": {},
-                    "face_index": 0
-                },
-                "text": {
-                    "content": "C",
-                    "script": "Latn",
-                    "direction": "ltr",
-                    "language": "en"
-                },
-                "rendering": {
-                    "format": "pgm",
-                    "encoding": "base64",
-                    "width": 3000,
-                    "height": 1200
-                }
-            }
-        ]
-    }
-
-    # Convert to JSON string
-    spec_json = json.dumps(job_spec)
-
-    print(f"Processing {len(job_spec['jobs'])} jobs in parallel...")
+    # In production, you would generate thousands of these jobs; the
+    # template writer keeps that cheap (no intermediate dicts).
+    # For variable fonts, set "variations" to e.g. {"wght": 600.0}.
+    # haforu.process_jobs_buffered expects str, not bytes.
+    spec_json = build_spec(str(test_font.absolute()), GLYPHS).decode()
+
+    print(f"Processing {len(GLYPHS)} jobs in parallel...")
     print()
 
     # Process jobs using haforu
-    # The process_jobs() function returns an iterator that yields results
-    # as they complete, allowing you to process results progressively
+    # Results stream back as they complete, allowing you to process them
+    # progressively (haforu.process_jobs_buffered() yields every finished
+    # result as one JSONL bytes chunk, which iter_result_lines() splits)
     results_count = 0
-    for result_json in haforu.process_jobs(spec_json):
-        # Each result is a JSONL string containing rendering result
-        result = json.loads(result_json)
+    for result_line in iter_result_lines(spec_json):
+        # Each result is one JSON line containing the rendering result;
+        # only the fields printed below are extracted.
+        result = summarize_result(result_line)
 
         results_count += 1
         job_id = result["id"]
         status = result["status"]
 
-        print(f"Job {results_count}: {job_id}")
-        print(f"  Status: {status}")
+        # Collect each job's report and write it in one call; per-line
+        # print() costs a lock and a write() each, which adds up over
+        # thousands of jobs.
+        lines = [f"Job {results_count}: {job_id}", f"  Status: {status}"]
 
         if status == "success":
-            # Rendering data is base64-encoded PGM image
-            rendering = result["rendering"]
-            print(f"  Format: {rendering['format']}")
-            print(f"  Size: {rendering['width']}x{rendering['height']}")
-            print(f"  Data size: {len(rendering['data'])} bytes (base64)")
+            # Metrics mode: normalized density/beam, no image payload
+            lines.append(f"  Density: {result['metrics.density']:.4f}")
+            lines.append(f"  Beam: {result['metrics.beam']:.4f}")
+            lines.append(f"  Coverage: {result['metrics.coverage']:.4f}")
 
             # Timing information
-            timing = result["timing"]
-            print(f"  Timing: shape={timing['shape_ms']:.2f}ms, "
-                  f"render={timing['render_ms']:.2f}ms, "
-                  f"total={timing['total_ms']:.2f}ms")
+            lines.append(f"  Timing: shape={result['timing.shape_ms']:.2f}ms, "
+                         f"render={result['timing.render_ms']:.2f}ms, "
+                         f"total={result['timing.total_ms']:.2f}ms")
 
-            # To decode the image:
-            # import base64
-            # pgm_bytes = base64.b64decode(rendering['data'])
-            # You can then save to file or process further
+            # For pixels, switch the template to "format": "pgm" and view the
+            # decoded payload as an array without copying (skip the P5 header):
+            # pgm = base64.b64decode(json.loads(result_line)["rendering"]["data"])
+            # header_len = len(f"P5\n{width} {height}\n255\n")
+            # image = np.frombuffer(pgm, np.uint8, offset=header_len).reshape(height, width)
 
         elif status == "error":
-            print(f"  Error: {result.get('error', 'Unknown error')}")
+            lines.append(f"  Error: {result.get('error', 'Unknown error')}")
 
-        print()
+        sys.stdout.write("\n".join(lines) + "\n\n")
 
     print(f"Batch processing complete: {results_count} jobs processed")
 
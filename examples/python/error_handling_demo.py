@@ -85,13 +85,10 @@ def demo_batch_errors():
     print()
 
 
-def demo_streaming_errors():
+def demo_streaming_errors(session: haforu.StreamingSession):
     """Demonstrate error handling in streaming mode."""
     print("=== Streaming Mode Error Handling ===\n")
 
-    # Create a session for testing
-    session = haforu.StreamingSession()
-
     # Error 1: Invalid JSON in render()
     print("1. Testing invalid JSON in render()...")
     try:
@@ -149,10 +146,8 @@ def demo_streaming_errors():
         print(f"  ✓ Caught RuntimeError: {e}")
     print()
 
-    session.close()
-
 
-def demo_graceful_degradation():
+def demo_graceful_degradation(session: haforu.StreamingSession):
     """Demonstrate graceful degradation pattern."""
     print("=== Graceful Degradation Pattern ===\n")
 
@@ -163,8 +158,6 @@ def demo_graceful_degradation():
         "testdata/fonts/Arial-Black.ttf",  # This one should exist
     ]
 
-    session = haforu.StreamingSession()
-
     print("Attempting to render with fallback fonts...")
     for font_path in fonts_to_try:
         print(f"  Trying: {font_path}")
@@ -188,7 +181,6 @@ def demo_graceful_degradation():
         except Exception as e:
             print(f"  ✗ Exception: {e}")
 
-    session.close()
     print()
 
 
@@ -198,8 +190,15 @@ def main():
 
     try:
         demo_batch_errors()
-        demo_streaming_errors()
-        demo_graceful_degradation()
+
+        # One session (and font cache) shared by the streaming demos; errors
+        # never poison it, so there is no need to build a fresh one per demo.
+        session = haforu.StreamingSession(cache_size=128)
+        try:
+            demo_streaming_errors(session)
+            demo_graceful_degradation(session)
+        finally:
+            session.close()
 
         print("=== Demo Complete ===")
         print("\nKey takeaways:")
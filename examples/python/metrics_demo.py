@@ -6,7 +6,7 @@
 This example shows how to request metrics-only results from haforu by
 setting ``rendering.format`` to ``"metrics"``. Results omit the base64
 image blob and instead include a ``metrics`` object with normalized
-density/beam values in the JSON payload.
+density/beam/coverage values and the ink bounding box in the JSON payload.
 """
 
 from __future__ import annotations
@@ -59,6 +59,8 @@ def main() -> None:
     print("Metrics:")
     print(f"  Density: {density:.4f}")
     print(f"  Beam:    {beam:.4f}")
+    print(f"  Coverage: {metrics.get('coverage', 0.0):.4f}")
+    print(f"  Bbox:    {metrics.get('bbox')} (x, y, w, h)")
     print()
     print("Rendering data present?", "rendering" in payload)
 
@@ -28,6 +28,7 @@ def main():
         print(f"Error: Test font not found at {test_font}")
         print("Please adjust the font path in this script.")
         sys.exit(1)
+    font_path = str(test_font.absolute())
 
     # Create a streaming session with custom cache size
     # The session keeps fonts in memory for fast repeated access
@@ -43,72 +44,62 @@ def main():
         print(f"Rendering {len(glyphs)} glyphs sequentially...")
         print()
 
-        for glyph in glyphs:
-            # Create a job specification for this glyph
-            job = {
-                "id": f"Arial-Black_{glyph}_1000pt",
-                "font": {
-                    "path": str(test_font.absolute()),
-                    "size": 1000,
-                    "variations": {},
-                    "face_index": 0
-                },
-                "text": {
-                    "content": glyph,
-                    "script": "Latn",
-                    "direction": "ltr",
-                    "language": "en"
-                },
-                "rendering": {
-                    "format": "pgm",
-                    "encoding": "base64",
-                    "width": 3000,
-                    "height": 1200
-                }
+        # Constant job fields; each render only swaps in its id and text
+        base_job = {
+            "id": "",
+            "font": {
+                "path": font_path,
+                "size": 1000,
+                "variations": {},
+                "face_index": 0
+            },
+            "text": {
+                "content": "",
+                "script": "Latn",
+                "direction": "ltr",
+                "language": "en"
+            },
+            "rendering": {
+                "format": "pgm",
+                "encoding": "base64",
+                "width": 3000,
+                "height": 1200
             }
+        }
+
+        def job_json_for(job_id: str, content: str) -> str:
+            job = {**base_job, "id": job_id, "text": {**base_job["text"], "content": content}}
+            return json.dumps(job)
 
+        for glyph in glyphs:
             # Render using the session
             # Note: render() takes a JSON string and returns a JSON string
-            result_json = session.render(json.dumps(job))
+            result_json = session.render(job_json_for(f"Arial-Black_{glyph}_1000pt", glyph))
             result = json.loads(result_json)
 
             job_id = result["id"]
             status = result["status"]
             timing = result["timing"]
 
-            print(f"Glyph '{glyph}':")
-            print(f"  Job ID: {job_id}")
-            print(f"  Status: {status}")
-            print(f"  Timing: shape={timing['shape_ms']:.2f}ms, "
-                  f"render={timing['render_ms']:.2f}ms, "
-                  f"total={timing['total_ms']:.2f}ms")
+            # One write per glyph instead of one print() per line
+            lines = [
+                f"Glyph '{glyph}':",
+                f"  Job ID: {job_id}",
+                f"  Status: {status}",
+                f"  Timing: shape={timing['shape_ms']:.2f}ms, "
+                f"render={timing['render_ms']:.2f}ms, "
+                f"total={timing['total_ms']:.2f}ms",
+            ]
 
             if status == "success":
                 rendering = result["rendering"]
-                print(f"  Image: {rendering['width']}x{rendering['height']} pixels")
+                lines.append(f"  Image: {rendering['width']}x{rendering['height']} pixels")
 
-            print()
+            sys.stdout.write("\n".join(lines) + "\n\n")
 
         # Demonstrate cache benefits by rendering the same glyph again
         print("Rendering 'A' again to demonstrate cache benefit...")
-        job_a_again = {
-            "id": "Arial-Black_A_cached",
-            "font": {
-                "path": str(test_font.absolute()),
-                "size": 1000,
-                "variations": {},
-                "face_index": 0
-            },
-            "text": {"content": "A", "script": "Latn"},
-            "rendering": {
-                "format": "pgm",
-                "encoding": "base64",
-                "width": 3000,
-                "height": 1200
-            }
-        }
-
-        result_json = session.render(json.dumps(job_a_again))
+        result_json = session.render(job_json_for("Arial-Black_A_cached", "A"))
         result = json.loads(result_json)
         timing = result["timing"]
 
@@ -13,12 +13,17 @@ Example:
 
 from __future__ import annotations
 
+import json
+from typing import Any, Dict
+
 try:
     from haforu._haforu import (
         __version__,
         __doc__,
         process_jobs,
-        StreamingSession,
+        process_jobs_buffered,
+        StreamingSession as _StreamingSession,
+        CacheStats,
         is_available,
         align_and_compare,
         AlignCompareResult,
@@ -31,10 +36,43 @@ except ImportError as e:
         "Make sure haforu is properly installed with: pip install haforu"
     ) from e
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+if orjson is not None:
+
+    def _dumps(obj: Any) -> str:
+        # The bindings take str, not the bytes orjson produces
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+class StreamingSession(_StreamingSession):
+    """Persistent rendering session with font cache (see the native base class)."""
+
+    __slots__ = ()
+
+    def render_dict(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Render a job given as a dict and return the parsed result dict.
+
+        Shorthand for ``json.loads(session.render(json.dumps(job)))``; uses
+        ``orjson`` for both steps when it is installed.
+        """
+        return _loads(self.render(_dumps(job)))
+
+
 __all__ = [
     "__version__",
     "process_jobs",
+    "process_jobs_buffered",
     "StreamingSession",
+    "CacheStats",
     "is_available",
     "align_and_compare",
     "AlignCompareResult",
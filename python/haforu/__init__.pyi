@@ -8,7 +8,10 @@ from typing import Iterator, Optional, Any
 __version__: str
 
 def is_available() -> bool:
-    """Return True when haforu bindings and dependencies are ready."""
+    """Return True when haforu bindings and dependencies are ready.
+
+    The probe runs once per process; later calls return the cached result.
+    """
     ...
 
 def process_jobs(
@@ -18,6 +21,7 @@ def process_jobs(
     max_glyphs: int | None = ...,
     timeout_ms: int | None = ...,
     base_dir: str | None = ...,
+    force_format: str | None = ...,
 ) -> Iterator[str]:
     """Process a batch of rendering jobs in parallel.
 
@@ -27,6 +31,7 @@ def process_jobs(
         max_glyphs: Optional override for glyph cache capacity (0 disables cache)
         timeout_ms: Optional per-job timeout (milliseconds)
         base_dir: Restrict font paths to this directory
+        force_format: Rendering format applied to every job (e.g. "metrics")
 
     Returns:
         Iterator yielding JSONL result strings (one per completed job)
@@ -37,6 +42,51 @@ def process_jobs(
     """
     ...
 
+def process_jobs_buffered(
+    spec_json: str,
+    *,
+    batch_size: int = 64,
+    max_fonts: int | None = ...,
+    max_glyphs: int | None = ...,
+    timeout_ms: int | None = ...,
+    base_dir: str | None = ...,
+    force_format: str | None = ...,
+) -> Iterator[bytes]:
+    """Process jobs like :func:`process_jobs`, yielding results in chunks.
+
+    Each item is a ``bytes`` object with up to ``batch_size`` newline-terminated
+    JSON results; use ``chunk.splitlines()`` to recover individual records.
+
+    Raises:
+        ValueError: Invalid JSON, job specification, or ``batch_size`` < 1
+    """
+    ...
+
+class CacheStats:
+    """Snapshot of a session's font and glyph cache counters.
+
+    Counters are attributes; the read-only mapping protocol (``stats["name"]``,
+    ``get``, ``keys``/``values``/``items``, iteration, ``len``, ``dict(stats)``)
+    is kept for code written against the former dict return value.
+    """
+
+    capacity: int
+    entries: int
+    font_capacity: int
+    font_entries: int
+    glyph_capacity: int
+    glyph_entries: int
+    glyph_hits: int
+
+    def __getitem__(self, key: str) -> int: ...
+    def __contains__(self, key: str) -> bool: ...
+    def get(self, key: str, default: Any = None) -> Any: ...
+    def keys(self) -> list[str]: ...
+    def values(self) -> list[int]: ...
+    def items(self) -> list[tuple[str, int]]: ...
+    def __iter__(self) -> Iterator[str]: ...
+    def __len__(self) -> int: ...
+
 class StreamingSession:
     """Persistent rendering session with font cache.
 
@@ -88,18 +138,38 @@ class StreamingSession:
         size: float = 600.0,
         width: int = 128,
         height: int = 128,
+        ping: bool = False,
     ) -> bool:
-        """Prime caches (optionally rendering a font) for faster subsequent renders."""
+        """Prime caches (optionally rendering a font) for faster subsequent renders.
+
+        ``ping=True`` also runs the ``ping()`` liveness probe in the same call.
+        """
         ...
 
     def ping(self) -> bool:
         """Cheap liveness probe returning ``True`` while the session remains open."""
         ...
 
-    def cache_stats(self) -> dict[str, int]:
+    def cache_stats(self) -> CacheStats:
         """Return cache capacity and current entry count for font and glyph caches."""
         ...
 
+    def font_paths(self) -> list[str]:
+        """Return the sorted font paths currently held in the font cache."""
+        ...
+
+    def font_instances(self) -> list[tuple[str, dict[str, float]]]:
+        """Return the cached font instances as ``(path, variations)`` pairs, sorted by path."""
+        ...
+
+    def register_font(self, font_path: str, variations: dict[str, float] | None = None) -> None:
+        """Load a font into the session cache without rendering anything.
+
+        Raises:
+            RuntimeError: Font loading failed
+        """
+        ...
+
     def set_cache_size(self, cache_size: int) -> None:
         """Resize cache capacity (drops cached entries)."""
         ...
@@ -123,6 +193,75 @@ class StreamingSession:
         """
         ...
 
+    def render_batch(self, jobs_json: list[str]) -> list[str]:
+        """Render several jobs in parallel, returning results in input order.
+
+        Jobs share the session caches; malformed entries yield error results
+        instead of raising.
+
+        Args:
+            jobs_json: JSON strings, each containing a single Job specification
+
+        Returns:
+            One JSONL result string per input job
+        """
+        ...
+
+    def render_msgpack(self, job_msgpack: bytes) -> bytes:
+        """Render a single MessagePack-encoded job, skipping JSON on both sides.
+
+        Args:
+            job_msgpack: MessagePack map with the same fields as a JSON Job
+
+        Returns:
+            MessagePack-encoded result map with the same keys as ``render()``'s
+            JSON result; undecodable input yields an error result
+        """
+        ...
+
+    def render_dict(self, job: dict[str, Any]) -> dict[str, Any]:
+        """Render a job given as a dict and return the parsed result dict.
+
+        Shorthand for ``json.loads(session.render(json.dumps(job)))``; uses
+        ``orjson`` for both steps when it is installed.
+        """
+        ...
+
+    def render_raw(self, job_json: str) -> tuple[dict[str, Any], bytes]:
+        """Render a single job to raw 8-bit grayscale pixels, skipping encoding.
+
+        ``rendering.format`` and ``rendering.encoding`` are ignored.
+
+        Args:
+            job_json: JSON string containing a single Job
+
+        Returns:
+            ``(meta, pixels)``: ``meta`` holds ``id``, ``width``, ``height``,
+            ``stride`` (bytes per row) and ``total_ms``; ``pixels`` is the
+            row-major bitmap, e.g. for ``numpy.frombuffer``
+
+        Raises:
+            ValueError: Invalid JSON or job specification
+            RuntimeError: Font loading or rendering errors
+        """
+        ...
+
+    def render_into(self, job_json: str, out: Any) -> dict[str, Any]:
+        """Render a single job's raw pixels into a caller-owned buffer.
+
+        Like ``render_raw()`` but writes the bitmap into the first
+        ``width * height`` bytes of ``out`` (any writeable C-contiguous byte
+        buffer) so render loops can reuse one allocation.
+
+        Returns:
+            The same ``meta`` dict as ``render_raw()``
+
+        Raises:
+            ValueError: Invalid job, or ``out`` is read-only, non-contiguous or too small
+            RuntimeError: Font loading or rendering errors
+        """
+        ...
+
     def render_to_numpy(
         self,
         font_path: str,
@@ -134,6 +273,7 @@ class StreamingSession:
         script: str | None = None,
         direction: str | None = None,
         language: str | None = None,
+        out: Any | None = None,  # numpy.ndarray[numpy.uint8]
     ) -> Any:  # numpy.ndarray[numpy.uint8]
         """Render text directly to numpy array (zero-copy).
 
@@ -147,13 +287,52 @@ class StreamingSession:
             script: Script tag (default: "Latn")
             direction: Text direction (default: "ltr")
             language: str | None (default: "en")
+            out: Optional C-contiguous uint8 array of shape (height, width) to
+                render into; returned instead of allocating a new array
 
         Returns:
             2D numpy array of shape (height, width), dtype uint8
             Grayscale values 0-255
 
         Raises:
-            ValueError: Invalid parameters
+            ValueError: Invalid parameters or mismatched ``out`` array
+            RuntimeError: Font loading or rendering errors
+        """
+        ...
+
+    def render_to_numpy_batch(
+        self,
+        font_path: str,
+        texts: list[str],
+        size: float,
+        width: int,
+        height: int,
+        variations: dict[str, float] | None = None,
+        script: str | None = None,
+        direction: str | None = None,
+        language: str | None = None,
+        out: Any | None = None,  # numpy.ndarray[numpy.uint8]
+    ) -> Any:  # numpy.ndarray[numpy.uint8]
+        """Render several texts with shared settings into one stacked array.
+
+        Args:
+            font_path: Absolute path to font file
+            texts: Texts to render, one frame each
+            size: Font size in points
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+            variations: Variable font coordinates applied to every text
+            script: Script tag (default: "Latn")
+            direction: Text direction (default: "ltr")
+            language: Language tag (default: "en")
+            out: Optional C-contiguous uint8 array of shape
+                (len(texts), height, width) to render into
+
+        Returns:
+            3D numpy array of shape (len(texts), height, width), dtype uint8
+
+        Raises:
+            ValueError: Invalid parameters or mismatched ``out`` array
             RuntimeError: Font loading or rendering errors
         """
         ...
@@ -183,5 +362,7 @@ __all__ = [
     "__version__",
     "is_available",
     "process_jobs",
+    "process_jobs_buffered",
     "StreamingSession",
+    "CacheStats",
 ]
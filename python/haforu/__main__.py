@@ -9,19 +9,32 @@ allowing users to render fonts via `python -m haforu`.
 
 from __future__ import annotations
 
+import csv
 import json
+import mmap
 import os
+import re
 import sys
-import base64
+import textwrap
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 try:
-    import fire
-except ImportError:
-    print("Error: 'fire' package is required for the CLI.", file=sys.stderr)
-    print("Install it with: pip install fire", file=sys.stderr)
-    sys.exit(1)
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    # SIMD-accelerated drop-in for base64.b64decode (optional)
+    from pybase64 import b64decode
+except ImportError:  # pragma: no cover - optional speedup
+    from base64 import b64decode
 
 try:
     import haforu
@@ -31,6 +44,100 @@ except ImportError:
     sys.exit(1)
 
 
+if orjson is not None:
+
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+
+    def _dumps_line(obj: Any, _option: int = orjson.OPT_APPEND_NEWLINE) -> str:
+        """Serialize ``obj`` as one newline-terminated JSONL record."""
+        return orjson.dumps(obj, option=_option).decode()
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    # keep catching the stdlib exception.
+    _loads = orjson.loads
+else:
+
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        return json.dumps(obj, indent=2 if indent else None)
+
+    def _dumps_line(obj: Any) -> str:
+        """Serialize ``obj`` as one newline-terminated JSONL record."""
+        return json.dumps(obj) + "\n"
+
+    _loads = json.loads
+
+
+class MetricRow(NamedTuple):
+    """One job's outcome in the ``metrics`` command; ``error`` is set on failure."""
+
+    id: Optional[str]
+    density: float = 0.0
+    beam: float = 0.0
+    error: str = ""
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Serializable form: density/beam on success, the error otherwise."""
+        if self.error:
+            return {"id": self.id, "error": self.error}
+        return {"id": self.id, "density": self.density, "beam": self.beam}
+
+
+# Input files at least this large are validated incrementally when ijson is
+# available; smaller ones are parsed in one go.
+_STREAM_VALIDATE_MIN_BYTES = 64 << 20
+
+# Validation problems travel as (job index, code) pairs and are only turned
+# into text when reported; the index is None for spec-level problems.
+ValidationError = Tuple[Optional[int], str]
+
+_ERROR_MESSAGES = {
+    "root_not_object": "Root must be an object",
+    "missing_jobs": "Missing 'jobs' field",
+    "jobs_not_array": "'jobs' must be an array",
+    "job_not_object": "Job must be an object",
+    "missing_id": "Missing 'id' field",
+    "missing_font": "Missing 'font' field",
+    "bad_font_type": "'font' must be an object",
+    "missing_font_path": "Missing 'font.path'",
+    "missing_font_size": "Missing 'font.size'",
+    "bad_font_size": "'font.size' must be a number",
+    "missing_text": "Missing 'text' field",
+    "bad_text_type": "'text' must be an object",
+    "missing_text_content": "Missing 'text.content'",
+    "bad_rendering_type": "'rendering' must be an object",
+}
+
+
+def _format_error(error: ValidationError) -> str:
+    """Render a validation error tuple as the message shown to the user."""
+    index, code = error
+    if index is None:
+        return _ERROR_MESSAGES[code]
+    return f"Job [{index}]: {_ERROR_MESSAGES[code]}"
+
+
+# Human-format fast paths for successful results. Result keys are emitted in
+# a fixed order (id, status, then rendering or metrics), so the printed fields
+# can be matched without parsing -- in particular without materializing the
+# base64 image payload. Anything else (errors, escaped ids) is parsed.
+_NUMBER = r"(-?[0-9.]+(?:[eE][-+]?[0-9]+)?)"
+_RENDERING_RESULT_RE = re.compile(
+    r'\{"id":"([^"\\]*)","status":"success","rendering":\{"format":"(\w+)",'
+    r'"encoding":"\w+","data":"[^"]*","width":(\d+),"height":(\d+),'
+)
+_METRICS_RESULT_RE = re.compile(
+    r'\{"id":"([^"\\]*)","status":"success","metrics":\{"density":'
+    + _NUMBER
+    + r',"beam":'
+    + _NUMBER
+    + r","
+)
+
+# "axis=value" pairs of a comma-separated variation string, e.g. "wght=700,wdth=80"
+_VARIATION_RE = re.compile(r"(?:^|,)\s*(\w+)\s*=\s*([-+0-9.eE]+)\s*(?=,|$)")
+
+
 class HaforuCLI:
     """Haforu: High-performance batch font renderer.
 
@@ -54,6 +161,8 @@ class HaforuCLI:
         base_dir: Optional[str] = None,
         output: Optional[str] = None,
         format: str = "jsonl",
+        session: bool = False,
+        flush_every: int = 32,
     ) -> None:
         """Process a batch of rendering jobs.
 
@@ -65,24 +174,44 @@ class HaforuCLI:
             base_dir: Restrict font paths to this directory
             output: Output file (writes to stdout if not provided)
             format: Output format (jsonl, json, or human)
+            session: Render jobs in order through one warmed-up
+                StreamingSession instead of the parallel batch renderer
+            flush_every: Flush jsonl written to stdout after this many
+                results (every result when stdout is a terminal)
         """
-        job_spec = self._load_json(input)
-
+        self._check_output_format(format)
+        flush_every = self._resolve_flush_every(flush_every)
+        if session and (timeout_ms > 0 or base_dir):
+            print("Error: --session does not support --timeout_ms or --base_dir", file=sys.stderr)
+            sys.exit(1)
+        # The parallel renderer parses the spec itself, so it gets the raw
+        # text; only --session needs the jobs as Python objects.
+        spec_text = self._read_input(input)
+
+        # Results are written as they complete instead of being collected,
+        # so memory stays flat regardless of batch size.
+        write_result = self._result_writer(format, flush_every)
+        count = 0
         try:
-            iterator = haforu.process_jobs(
-                json.dumps(job_spec),
-                max_fonts=max_fonts,
-                max_glyphs=max_glyphs,
-                timeout_ms=timeout_ms if timeout_ms > 0 else None,
-                base_dir=base_dir,
-            )
-            results = list(iterator)
+            with self._output_stream(output, binary=format == "jsonl") as output_file:
+                if session:
+                    iterator = self._session_results(_loads(spec_text), max_fonts, max_glyphs)
+                else:
+                    iterator = haforu.process_jobs(
+                        spec_text,
+                        max_fonts=max_fonts,
+                        max_glyphs=max_glyphs,
+                        timeout_ms=timeout_ms if timeout_ms > 0 else None,
+                        base_dir=base_dir,
+                    )
+                for result in iterator:
+                    write_result(result, output_file, count)
+                    count += 1
+                self._finish_results(output_file, format, count)
         except Exception as exc:  # pragma: no cover - surfaces native errors
             print(f"Error processing jobs: {exc}", file=sys.stderr)
             sys.exit(1)
 
-        self._output_results(results, output, format)
-
     def stream(
         self,
         input: Optional[str] = None,
@@ -90,6 +219,9 @@ class HaforuCLI:
         max_glyphs: int = 2048,
         output: Optional[str] = None,
         format: str = "jsonl",
+        batch_size: int = 1,
+        flush_every: int = 1,
+        warm_cache: bool = False,
     ) -> None:
         """Process jobs in streaming mode (JSONL input).
 
@@ -99,10 +231,27 @@ class HaforuCLI:
             max_glyphs: Maximum number of glyphs to cache
             output: Output file (writes to stdout if not provided)
             format: Output format (jsonl, json, or human)
+            batch_size: Lines rendered together in parallel. The default of 1
+                answers each line before reading the next, which interactive
+                drivers waiting on a reply rely on; raise it for file input.
+            flush_every: Flush jsonl written to stdout after this many
+                results. The default of 1 is what request/response drivers
+                need; raise it together with batch_size for throughput.
+            warm_cache: Pre-load the font instances (variation locations
+                included) the previous --warm_cache run used, and record this
+                run's instances for the next one
         """
+        self._check_output_format(format)
+        flush_every = self._resolve_flush_every(flush_every)
+        if batch_size < 1:
+            print("Error: --batch_size must be at least 1", file=sys.stderr)
+            sys.exit(1)
+
         # Create streaming session
         session = haforu.StreamingSession(max_fonts=max_fonts, max_glyphs=max_glyphs)
         session.warm_up()
+        if warm_cache:
+            self._prewarm_fonts(session)
 
         if self.verbose:
             print(f"Streaming session initialized", file=sys.stderr)
@@ -110,57 +259,56 @@ class HaforuCLI:
 
         # Open input
         if input:
-            input_file = open(input, "r")
+            # Lines go to the session as str, so decoding is unavoidable; do
+            # it as UTF-8 (the JSON encoding) in large reads rather than with
+            # the locale codec and the default 8 KiB buffer.
+            input_file = open(input, "r", encoding="utf-8", buffering=1 << 16)
         else:
             if self.verbose:
                 print("Reading from stdin...", file=sys.stderr)
             input_file = sys.stdin
 
-        # Open output
-        if output:
-            output_file = open(output, "w")
-        else:
-            output_file = sys.stdout
-
-        # Process lines
-        results = []
+        # Process lines. StreamingSession.render() parses the job itself and
+        # reports malformed JSON as an error result, so lines are passed
+        # through untouched and results are only parsed for non-jsonl output.
+        write_result = self._result_writer(format, flush_every)
+        # Bound once: the loop body runs per input line
+        render = session.render
+        render_batch = session.render_batch
+        count = 0
+        pending: List[str] = []
+        queue_line = pending.append
         try:
-            for line in input_file:
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    job = json.loads(line)
-                    result = session.render(json.dumps(job))
-                    result_obj = json.loads(result)
-
-                    if format == "jsonl":
-                        print(result, file=output_file, flush=True)
-                    else:
-                        results.append(result_obj)
-
-                except json.JSONDecodeError as e:
-                    error_result = {
-                        "id": "unknown",
-                        "status": "error",
-                        "error": f"Invalid JSON: {e}",
-                    }
-                    if format == "jsonl":
-                        print(json.dumps(error_result), file=output_file, flush=True)
-                    else:
-                        results.append(error_result)
+            with self._output_stream(output, binary=format == "jsonl") as output_file:
+                for line in input_file:
+                    line = line.strip()
+                    if not line:
+                        continue
+
+                    if batch_size == 1:
+                        write_result(render(line), output_file, count)
+                        count += 1
+                        continue
+
+                    queue_line(line)
+                    if len(pending) >= batch_size:
+                        for result in render_batch(pending):
+                            write_result(result, output_file, count)
+                            count += 1
+                        pending.clear()
+
+                if pending:
+                    for result in render_batch(pending):
+                        write_result(result, output_file, count)
+                        count += 1
+                self._finish_results(output_file, format, count)
 
         finally:
+            if warm_cache:
+                self._save_warm_fonts(session)
             session.close()
             if input:
                 input_file.close()
-            if output:
-                output_file.close()
-
-        # Output collected results for non-jsonl formats
-        if format != "jsonl":
-            self._output_results([json.dumps(r) for r in results], output, format)
 
     def render(
         self,
@@ -220,14 +368,10 @@ class HaforuCLI:
             },
         }
 
-        payload = {"version": "1.0", "jobs": [job]}
-        iterator = haforu.process_jobs(json.dumps(payload))
-        results = list(iterator)
-        if not results:
-            print("Error: No results returned", file=sys.stderr)
-            sys.exit(1)
-
-        result = json.loads(results[0])
+        # A single job needs neither the batch envelope nor the parallel
+        # renderer's worker thread; a throwaway session renders it inline.
+        with haforu.StreamingSession(max_fonts=1, max_glyphs=0) as session:
+            result = _loads(session.render(_dumps(job)))
         if result.get("status") == "error":
             print(f"Error: {result.get('error', 'Unknown error')}", file=sys.stderr)
             sys.exit(1)
@@ -244,7 +388,11 @@ class HaforuCLI:
             print("Error: No image data returned", file=sys.stderr)
             sys.exit(1)
 
-        image_bytes = base64.b64decode(data)
+        # Results are JSON, so the image has to arrive base64-encoded; decode
+        # it once and write the bytes straight out. The payload comes from our
+        # own encoder, so validate=True is safe and lets pybase64 skip its
+        # character-filtering pass.
+        image_bytes = b64decode(data, validate=True)
         if output:
             with open(output, "wb") as handle:
                 handle.write(image_bytes)
@@ -278,51 +426,72 @@ class HaforuCLI:
             output=output,
         )
 
-    def validate(self, input: Optional[str] = None) -> None:
+    def validate(self, input: Optional[str] = None, fast: bool = False) -> None:
         """Validate a JSON job specification.
 
         Args:
             input: Input file to validate (reads from stdin if not provided)
+            fast: Stop at the first error instead of reporting all of them
         """
-        # Read input
-        if input:
-            with open(input, "r") as f:
-                content = f.read()
+        # One orjson parse of a memory-mapped file beats ijson's event stream
+        # whenever the parsed spec comfortably fits in memory.
+        one_shot = (
+            orjson is not None
+            and input is not None
+            and os.path.getsize(input) < _STREAM_VALIDATE_MIN_BYTES
+        )
+        if ijson is not None and not one_shot:
+            # Stream the spec: each job is built, checked and dropped, so
+            # memory stays flat however many jobs the file holds.
+            if input:
+                with open(input, "rb") as f:
+                    errors, version, job_count = self._validate_stream(f, fast)
+            else:
+                errors, version, job_count = self._validate_stream(sys.stdin.buffer, fast)
         else:
-            content = sys.stdin.read()
-
-        # Try to parse as JSON
-        try:
-            job_spec = json.loads(content)
-        except json.JSONDecodeError as e:
-            print(f"Invalid JSON: {e}", file=sys.stderr)
-            sys.exit(1)
-
-        # Validate structure
-        errors = []
+            # Try to parse as JSON
+            try:
+                job_spec = self._load_json(input)
+            except json.JSONDecodeError as e:
+                print(f"Invalid JSON: {e}", file=sys.stderr)
+                sys.exit(1)
 
-        if not isinstance(job_spec, dict):
-            errors.append("Root must be an object")
+            # Validate structure
+            errors: List[ValidationError] = []
 
-        if "jobs" not in job_spec:
-            errors.append("Missing 'jobs' field")
-        elif not isinstance(job_spec.get("jobs"), list):
-            errors.append("'jobs' must be an array")
-        else:
-            for i, job in enumerate(job_spec["jobs"]):
-                job_errors = self._validate_job(job, i)
-                errors.extend(job_errors)
+            if not isinstance(job_spec, dict):
+                errors.append((None, "root_not_object"))
+            elif "jobs" not in job_spec:
+                errors.append((None, "missing_jobs"))
+            elif not isinstance(job_spec.get("jobs"), list):
+                errors.append((None, "jobs_not_array"))
+            else:
+                jobs = job_spec["jobs"]
+                if fast:
+                    # First error only: a lazy scan across every job's checks
+                    error = next(
+                        (e for i, job in enumerate(jobs) for e in self._validate_job(job, i)),
+                        None,
+                    )
+                    if error is not None:
+                        errors.append(error)
+                else:
+                    for i, job in enumerate(jobs):
+                        errors.extend(self._validate_job(job, i))
+
+            version = job_spec.get("version", "unspecified") if isinstance(job_spec, dict) else None
+            job_count = len(job_spec.get("jobs", [])) if isinstance(job_spec, dict) else 0
 
         # Report results
         if errors:
             print("Validation failed:", file=sys.stderr)
             for error in errors:
-                print(f"  - {error}", file=sys.stderr)
+                print(f"  - {_format_error(error)}", file=sys.stderr)
             sys.exit(1)
         else:
             print("✓ Valid job specification")
-            print(f"  Version: {job_spec.get('version', 'unspecified')}")
-            print(f"  Jobs: {len(job_spec.get('jobs', []))}")
+            print(f"  Version: {version}")
+            print(f"  Jobs: {job_count}")
 
     def metrics(
         self,
@@ -337,67 +506,37 @@ class HaforuCLI:
             output: Output file (writes to stdout if not provided)
             format: Output format (json, jsonl, or csv)
         """
-        # Read input
-        if input:
-            with open(input, "r") as f:
-                job_spec = json.load(f)
-        else:
-            job_spec = json.load(sys.stdin)
-
-        # Convert all jobs to metrics format
-        for job in job_spec.get("jobs", []):
-            if "rendering" in job:
-                job["rendering"]["format"] = "metrics"
-
-        # Process jobs
-        results = haforu.process_jobs(json.dumps(job_spec))
-
-        # Extract metrics
-        metrics_data = []
-        for result_str in results:
-            result = json.loads(result_str)
-            if result.get("status") == "success":
-                metrics = result.get("metrics", {})
-                metrics_data.append(
-                    {
-                        "id": result.get("id"),
-                        "density": metrics.get("density", 0),
-                        "beam": metrics.get("beam", 0),
-                    }
-                )
-            else:
-                metrics_data.append(
-                    {
-                        "id": result.get("id"),
-                        "error": result.get("error", "Unknown error"),
-                    }
-                )
+        # The renderer switches every job to metrics itself, so the spec is
+        # passed through without being parsed here. Rows are produced lazily:
+        # each result is written while the next one renders.
+        spec_text = self._read_input(input)
+        metrics_data = self._metric_rows(
+            haforu.process_jobs(spec_text, force_format="metrics")
+        )
 
         # Output results
-        if output:
-            output_file = open(output, "w")
-        else:
-            output_file = sys.stdout
-
-        try:
+        with self._output_stream(output) as output_file:
             if format == "json":
-                json.dump(metrics_data, output_file, indent=2)
+                # Same layout as _dumps(rows, indent=True), one row at a time
+                count = 0
+                for count, row in enumerate(metrics_data, 1):
+                    item = textwrap.indent(_dumps(row.as_dict(), indent=True), "  ")
+                    output_file.write(("[\n" if count == 1 else ",\n") + item)
+                output_file.write("\n]" if count else "[]")
             elif format == "jsonl":
-                for item in metrics_data:
-                    print(json.dumps(item), file=output_file)
+                write = output_file.write
+                for row in metrics_data:
+                    write(_dumps_line(row.as_dict()))
             elif format == "csv":
-                print("id,density,beam,error", file=output_file)
-                for item in metrics_data:
-                    if "error" in item:
-                        print(f"{item['id']},,,,{item['error']}", file=output_file)
-                    else:
-                        print(
-                            f"{item['id']},{item['density']:.4f},{item['beam']:.4f},",
-                            file=output_file,
-                        )
-        finally:
-            if output:
-                output_file.close()
+                # csv.writer quotes error messages that contain commas
+                writer = csv.writer(output_file, lineterminator="\n")
+                writer.writerow(["id", "density", "beam", "error"])
+                writer.writerows(
+                    (row.id, "", "", row.error)
+                    if row.error
+                    else (row.id, f"{row.density:.4f}", f"{row.beam:.4f}", "")
+                    for row in metrics_data
+                )
 
     def version(self) -> None:
         """Print version information."""
@@ -415,7 +554,7 @@ class HaforuCLI:
             "default_max_glyphs": 2048,
         }
         if format == "json":
-            print(json.dumps(report, indent=2))
+            print(_dumps(report, indent=True))
             return
         print(f"haforu {report['cli_version']}")
         print(f"Status       : {report['status']}")
@@ -424,114 +563,310 @@ class HaforuCLI:
             "Cache defaults: fonts={default_max_fonts} glyphs={default_max_glyphs}".format(**report)
         )
 
-    def _validate_job(self, job: dict, index: int) -> List[str]:
+    def _metric_rows(self, results: Iterator[str]) -> Iterator[MetricRow]:
+        """Turn ``process_jobs`` results into :class:`MetricRow` items as they arrive."""
+        for result_str in results:
+            result = _loads(result_str)
+            if result.get("status") == "success":
+                metrics = result.get("metrics", {})
+                yield MetricRow(result.get("id"), metrics.get("density", 0), metrics.get("beam", 0))
+            else:
+                yield MetricRow(result.get("id"), error=result.get("error", "Unknown error"))
+
+    def _validate_stream(self, handle: Any, fast: bool = False) -> tuple:
+        """Validate a job spec incrementally with ijson.
+
+        Args:
+            handle: Binary file object holding the spec
+            fast: Stop reading at the first error
+
+        Returns:
+            Tuple of (errors, version, job count)
+        """
+        errors: List[ValidationError] = []
+        version: Any = "unspecified"
+        has_jobs = False
+        jobs_is_array = False
+        job_count = 0
+        builder = None
+        try:
+            for prefix, event, value in ijson.parse(handle, use_float=True):
+                if builder is not None:
+                    # Inside a job: feed events until its container closes
+                    builder.event(event, value)
+                    if prefix == "jobs.item" and event in ("end_map", "end_array"):
+                        errors.extend(self._validate_job(builder.value, job_count))
+                        job_count += 1
+                        builder = None
+                        if fast and errors:
+                            del errors[1:]
+                            break
+                elif prefix == "jobs.item":
+                    if event in ("start_map", "start_array"):
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    else:
+                        errors.extend(self._validate_job(value, job_count))
+                        job_count += 1
+                        if fast and errors:
+                            del errors[1:]
+                            break
+                elif prefix == "":
+                    if event == "map_key" and value == "jobs":
+                        has_jobs = True
+                    elif event not in ("start_map", "map_key", "end_map"):
+                        errors.append((None, "root_not_object"))
+                        break
+                elif prefix == "jobs" and event == "start_array":
+                    jobs_is_array = True
+                elif prefix == "version" and event in ("string", "number"):
+                    version = value
+        except ijson.JSONError as e:
+            print(f"Invalid JSON: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        if not errors:
+            if not has_jobs:
+                errors.append((None, "missing_jobs"))
+            elif not jobs_is_array:
+                errors.append((None, "jobs_not_array"))
+        return errors, version, job_count
+
+    def _validate_job(self, job: dict, index: int) -> Iterator[ValidationError]:
         """Validate a single job object.
 
         Args:
             job: Job dictionary to validate
             index: Job index in the array
 
-        Returns:
-            List of error messages
+        Yields:
+            ``(index, code)`` tuples; see ``_ERROR_MESSAGES`` for the codes
         """
-        errors = []
-        prefix = f"Job [{index}]"
+        if not isinstance(job, dict):
+            yield index, "job_not_object"
+            return
 
         # Check required fields
         if "id" not in job:
-            errors.append(f"{prefix}: Missing 'id' field")
+            yield index, "missing_id"
 
         if "font" not in job:
-            errors.append(f"{prefix}: Missing 'font' field")
+            yield index, "missing_font"
         elif not isinstance(job["font"], dict):
-            errors.append(f"{prefix}: 'font' must be an object")
+            yield index, "bad_font_type"
         else:
             font = job["font"]
             if "path" not in font:
-                errors.append(f"{prefix}: Missing 'font.path'")
+                yield index, "missing_font_path"
             if "size" not in font:
-                errors.append(f"{prefix}: Missing 'font.size'")
+                yield index, "missing_font_size"
             elif not isinstance(font["size"], (int, float)):
-                errors.append(f"{prefix}: 'font.size' must be a number")
+                yield index, "bad_font_size"
 
         if "text" not in job:
-            errors.append(f"{prefix}: Missing 'text' field")
+            yield index, "missing_text"
         elif not isinstance(job["text"], dict):
-            errors.append(f"{prefix}: 'text' must be an object")
+            yield index, "bad_text_type"
         elif "content" not in job["text"]:
-            errors.append(f"{prefix}: Missing 'text.content'")
+            yield index, "missing_text_content"
 
         if "rendering" in job:
             rendering = job["rendering"]
             if not isinstance(rendering, dict):
-                errors.append(f"{prefix}: 'rendering' must be an object")
+                yield index, "bad_rendering_type"
 
-        return errors
+    def _session_results(
+        self, job_spec: Dict[str, Any], max_fonts: int, max_glyphs: int
+    ) -> Iterator[str]:
+        """Render ``job_spec`` jobs one by one through a single StreamingSession.
 
-    def _output_results(self, results: List[str], output: Optional[str], format: str) -> None:
-        """Output results in the specified format.
+        The session is warmed up before the first job and keeps fonts and
+        glyphs cached for the whole batch; results come back in input order.
+        """
+        streaming = haforu.StreamingSession(max_fonts=max_fonts, max_glyphs=max_glyphs)
+        try:
+            streaming.warm_up()
+            for job in job_spec.get("jobs", []):
+                yield streaming.render(_dumps(job))
+        finally:
+            streaming.close()
+
+    def _prewarm_fonts(self, session: Any) -> None:
+        """Load the font instances recorded by :meth:`_save_warm_fonts` into ``session``."""
+        try:
+            entries = _loads(_warm_fonts_file().read_bytes())
+        except (OSError, ValueError):
+            return
+        if not isinstance(entries, list):
+            return
+        # Loading past capacity would only evict instances loaded a moment ago
+        for entry in entries[: session.cache_stats().font_capacity]:
+            # Bare paths (older lists) name the default instance
+            if isinstance(entry, str):
+                path, variations = entry, None
+            elif isinstance(entry, dict):
+                path, variations = entry.get("path"), entry.get("variations")
+            else:
+                continue
+            if not isinstance(path, str) or not isinstance(variations, (dict, type(None))):
+                continue
+            try:
+                session.register_font(path, variations)
+            except (RuntimeError, OSError, TypeError) as exc:  # moved, broken or bad coordinates
+                if self.verbose:
+                    print(f"Skipping cached font {path}: {exc}", file=sys.stderr)
+        if self.verbose:
+            print(f"Pre-loaded fonts: {session.cache_stats().font_entries}", file=sys.stderr)
+
+    def _save_warm_fonts(self, session: Any) -> None:
+        """Record the session's cached font instances for the next ``--warm_cache`` run.
+
+        The font cache never holds more than ``max_fonts`` instances, so the
+        list needs no trimming here.
+        """
+        cache_file = _warm_fonts_file()
+        entries = [
+            {"path": path, "variations": variations}
+            for path, variations in session.font_instances()
+        ]
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(_dumps(entries))
+        except OSError as exc:
+            if self.verbose:
+                print(f"Could not save font cache list: {exc}", file=sys.stderr)
+
+    def _check_output_format(self, format: str) -> None:
+        """Exit early when ``format`` is not a supported result format."""
+        if format not in ("jsonl", "json", "human"):
+            print(f"Error: Unknown format: {format}", file=sys.stderr)
+            sys.exit(1)
+
+    def _resolve_flush_every(self, flush_every: int) -> int:
+        """Check ``--flush_every``; terminals always get per-result flushes."""
+        if flush_every < 1:
+            print("Error: --flush_every must be at least 1", file=sys.stderr)
+            sys.exit(1)
+        return 1 if sys.stdout.isatty() else flush_every
+
+    @contextmanager
+    def _output_stream(self, output: Optional[str], binary: bool = False) -> Iterator[Any]:
+        """Yield the command's output stream: the ``output`` file or stdout.
+
+        Files get a 1 MiB buffer so large runs make few ``write()`` calls and
+        are closed on exit; stdout is only flushed. Pass ``binary=True`` for
+        jsonl results, which are written verbatim and skip the text layer.
+        """
+        if not output:
+            stream = sys.stdout.buffer if binary else sys.stdout
+            try:
+                yield stream
+            finally:
+                stream.flush()
+            return
+        with open(output, "wb" if binary else "w", buffering=1 << 20) as handle:
+            yield handle
+
+    def _result_writer(self, format: str, flush_every: int = 1) -> Callable[[str, Any, int], None]:
+        """Resolve the per-result writer for ``format`` once, outside the loop.
 
         Args:
-            results: List of JSON strings
-            output: Output file path (None for stdout)
             format: Output format (json, jsonl, or human)
+            flush_every: Flush jsonl on stdout after this many results
+
+        Returns:
+            ``write(result, output_file, index)``, where ``output_file`` comes
+            from :meth:`_output_stream` and ``index`` is the zero-based
+            position of the result in the output
         """
-        if output:
-            output_file = open(output, "w")
-        else:
-            output_file = sys.stdout
+        if format == "json":
+            return self._write_json_result
+        if format == "human":
+            return self._write_human_result
+
+        stdout = sys.stdout.buffer
+
+        def write_jsonl(result: str, output_file: Any, index: int) -> None:
+            output_file.write(result.encode() + b"\n")
+            # Periodic flushes keep stdout consumers streaming without a
+            # syscall per result; files rely on normal block buffering and
+            # whatever is left is flushed when the stream closes.
+            if output_file is stdout and (index + 1) % flush_every == 0:
+                output_file.flush()
+
+        return write_jsonl
+
+    def _write_json_result(self, result: str, output_file: Any, index: int) -> None:
+        """Write one result as an item of a JSON array."""
+        # Results are already serialized JSON, so each becomes one compact
+        # array item on its own line with no re-parse; _finish_results()
+        # closes the array.
+        output_file.write(("[\n  " if index == 0 else ",\n  ") + result)
+
+    def _write_human_result(self, result: str, output_file: Any, index: int) -> None:
+        """Write one result as a one-line human-readable summary."""
+        write = output_file.write
+        match = _RENDERING_RESULT_RE.match(result)
+        if match is not None:
+            job_id, image_format, width, height = match.groups()
+            write(f"✓ {job_id}: {width}x{height} {image_format}\n")
+            return
+        match = _METRICS_RESULT_RE.match(result)
+        if match is not None:
+            job_id, density, beam = match.groups()
+            write(f"✓ {job_id}: density={float(density):.4f}, beam={float(beam):.4f}\n")
+            return
 
-        try:
-            if format == "jsonl":
-                for result in results:
-                    print(result, file=output_file)
-
-            elif format == "json":
-                parsed_results = [json.loads(r) for r in results]
-                json.dump(parsed_results, output_file, indent=2)
-
-            elif format == "human":
-                for result_str in results:
-                    result = json.loads(result_str)
-                    status = result.get("status", "unknown")
-                    job_id = result.get("id", "unknown")
-
-                    if status == "success":
-                        rendering = result.get("rendering", {})
-                        metrics = result.get("metrics", {})
-
-                        if metrics:
-                            print(
-                                f"✓ {job_id}: density={metrics.get('density', 0):.4f}, "
-                                f"beam={metrics.get('beam', 0):.4f}",
-                                file=output_file,
-                            )
-                        else:
-                            print(
-                                f"✓ {job_id}: {rendering.get('width', 0)}x"
-                                f"{rendering.get('height', 0)} {rendering.get('format', 'unknown')}",
-                                file=output_file,
-                            )
-                    else:
-                        error = result.get("error", "Unknown error")
-                        print(f"✗ {job_id}: {error}", file=output_file)
+        parsed = _loads(result)
+        status = parsed.get("status", "unknown")
+        job_id = parsed.get("id", "unknown")
 
+        if status == "success":
+            rendering = parsed.get("rendering", {})
+            metrics = parsed.get("metrics", {})
+
+            if metrics:
+                write(
+                    f"✓ {job_id}: density={metrics.get('density', 0):.4f}, "
+                    f"beam={metrics.get('beam', 0):.4f}\n"
+                )
             else:
-                print(f"Error: Unknown format: {format}", file=sys.stderr)
-                sys.exit(1)
+                write(
+                    f"✓ {job_id}: {rendering.get('width', 0)}x"
+                    f"{rendering.get('height', 0)} {rendering.get('format', 'unknown')}\n"
+                )
+        else:
+            error = parsed.get("error", "Unknown error")
+            write(f"✗ {job_id}: {error}\n")
 
-        finally:
-            if output:
-                output_file.close()
+    def _finish_results(self, output_file: Any, format: str, count: int) -> None:
+        """Terminate output started by a :meth:`_result_writer` writer."""
+        if format == "json":
+            output_file.write("\n]" if count else "[]")
 
-    def _load_json(self, path: Optional[str]) -> Dict[str, Any]:
-        """Load JSON from a file or stdin."""
+    def _read_input(self, path: Optional[str]) -> str:
+        """Read raw input text from a file or stdin."""
         if path:
             with open(path, "r", encoding="utf-8") as handle:
-                return json.load(handle)
+                return handle.read()
         if self.verbose:
             print("Reading from stdin...", file=sys.stderr)
-        return json.load(sys.stdin)
+        return sys.stdin.read()
+
+    def _load_json(self, path: Optional[str]) -> Dict[str, Any]:
+        """Load JSON from a file or stdin.
+
+        With orjson, files are parsed straight out of a read-only memory map
+        instead of being copied into a Python string first.
+        """
+        if path and orjson is not None:
+            with open(path, "rb") as handle:
+                if os.fstat(handle.fileno()).st_size:
+                    with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        # Release the view before the map closes
+                        with memoryview(mapped) as view:
+                            return orjson.loads(view)
+        return _loads(self._read_input(path))
 
     def _parse_variations(self, raw: Optional[str]) -> Dict[str, float]:
         """Parse variation coordinates from CLI input."""
@@ -542,29 +877,40 @@ class HaforuCLI:
             return {}
         if text.startswith("{"):
             try:
-                data = json.loads(text)
+                data = _loads(text)
             except json.JSONDecodeError as exc:  # pragma: no cover - user error
                 print(f"Invalid variations JSON: {exc}", file=sys.stderr)
                 sys.exit(1)
             return {k: float(v) for k, v in data.items()}
-        coords: Dict[str, float] = {}
-        for token in text.split(","):
-            if "=" not in token:
-                continue
-            axis, value = token.split("=", 1)
-            axis = axis.strip()
-            if not axis:
-                continue
-            try:
-                coords[axis] = float(value)
-            except ValueError:
-                print(f"Invalid variation value: {token}", file=sys.stderr)
-                sys.exit(1)
-        return coords
+        # One C-level scan; every "=" must belong to a well-formed pair, so a
+        # token like "wght=bold" is reported instead of silently dropped.
+        pairs = _VARIATION_RE.findall(text)
+        if len(pairs) != text.count("="):
+            print(f"Invalid variation value: {text}", file=sys.stderr)
+            sys.exit(1)
+        try:
+            return {axis: float(value) for axis, value in pairs}
+        except ValueError:
+            print(f"Invalid variation value: {text}", file=sys.stderr)
+            sys.exit(1)
+
+
+def _warm_fonts_file() -> Path:
+    """Where ``stream --warm_cache`` keeps the font instances of its last run."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "haforu" / "fonts.json"
 
 
 def main():
     """Main entry point for the CLI."""
+    # Imported here so importing HaforuCLI does not pay for fire's startup
+    try:
+        import fire
+    except ImportError:
+        print("Error: 'fire' package is required for the CLI.", file=sys.stderr)
+        print("Install it with: pip install fire", file=sys.stderr)
+        sys.exit(1)
+
     fire.Fire(HaforuCLI)
 
 
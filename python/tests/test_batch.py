@@ -227,5 +227,46 @@ def test_process_jobs_metrics_format_returns_metrics_payload():
     assert "metrics" in payload
     assert "rendering" not in payload
     metrics = payload["metrics"]
-    for key in ("density", "beam"):
+    for key in ("density", "beam", "coverage"):
         assert 0.0 <= metrics[key] <= 1.0, f"{key} out of range"
+    x, y, w, h = metrics["bbox"]
+    assert x + w <= 64 and y + h <= 64
+
+
+def test_process_jobs_buffered_yields_jsonl_chunks():
+    """Buffered batch mode returns every result, grouped into bytes chunks."""
+    try:
+        import haforu
+    except ImportError:
+        pytest.skip("haforu Python bindings not installed")
+
+    spec = {
+        "version": "1.0",
+        "jobs": [
+            {
+                "id": f"chunk-{index}",
+                "font": {
+                    "path": "testdata/fonts/Arial-Black.ttf",
+                    "size": 256,
+                    "variations": {},
+                },
+                "text": {"content": glyph},
+                "rendering": {
+                    "format": "metrics",
+                    "encoding": "json",
+                    "width": 64,
+                    "height": 64,
+                },
+            }
+            for index, glyph in enumerate("ABCDE")
+        ],
+    }
+
+    chunks = list(haforu.process_jobs_buffered(json.dumps(spec), batch_size=2))
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    results = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+    assert all(len(chunk.splitlines()) <= 2 for chunk in chunks)
+    assert sorted(result["id"] for result in results) == [f"chunk-{i}" for i in range(5)]
+
+    with pytest.raises(ValueError, match="batch_size"):
+        haforu.process_jobs_buffered(json.dumps(spec), batch_size=0)
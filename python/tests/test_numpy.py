@@ -320,3 +320,118 @@ def test_render_to_numpy_vs_base64_consistency():
     # Both should produce consistent error status
     if numpy_image is None:
         assert result["status"] == "error"
+
+
+def test_render_to_numpy_out_buffer_is_reused():
+    """Passing ``out`` renders in place and returns the same array."""
+    try:
+        import haforu
+        import numpy as np
+    except ImportError:
+        pytest.skip("haforu or numpy not installed")
+
+    from pathlib import Path
+
+    font_path = Path(__file__).parent.parent.parent / "testdata" / "fonts" / "Arial-Black.ttf"
+    session = haforu.StreamingSession()
+    fresh = session.render_to_numpy(str(font_path), "a", 64.0, 96, 80)
+
+    buf = np.full((80, 96), 7, dtype=np.uint8)
+    image = session.render_to_numpy(str(font_path), "a", 64.0, 96, 80, out=buf)
+    assert image is buf
+    assert np.array_equal(buf, fresh)
+
+    with pytest.raises(ValueError):
+        session.render_to_numpy(
+            str(font_path), "a", 64.0, 96, 80, out=np.empty((80, 95), dtype=np.uint8)
+        )
+
+
+def test_render_to_numpy_batch_stacks_frames():
+    """Batch renders return one (M, H, W) array matching per-glyph renders."""
+    try:
+        import haforu
+        import numpy as np
+    except ImportError:
+        pytest.skip("haforu or numpy not installed")
+
+    from pathlib import Path
+
+    font_path = Path(__file__).parent.parent.parent / "testdata" / "fonts" / "Arial-Black.ttf"
+    session = haforu.StreamingSession()
+    glyphs = ["a", "B", "M"]
+    images = session.render_to_numpy_batch(str(font_path), glyphs, 64.0, 96, 80)
+    assert images.shape == (3, 80, 96)
+    assert images.dtype == np.uint8
+    for index, glyph in enumerate(glyphs):
+        single = session.render_to_numpy(str(font_path), glyph, 64.0, 96, 80)
+        assert np.array_equal(images[index], single)
+
+    buf = np.empty((3, 80, 96), dtype=np.uint8)
+    assert session.render_to_numpy_batch(str(font_path), glyphs, 64.0, 96, 80, out=buf) is buf
+    assert np.array_equal(buf, images)
+
+
+def test_render_raw_matches_render_to_numpy():
+    """render_raw returns unencoded pixels that numpy can wrap without copying."""
+    try:
+        import haforu
+        import numpy as np
+    except ImportError:
+        pytest.skip("haforu or numpy not installed")
+
+    from pathlib import Path
+
+    font_path = Path(__file__).parent.parent.parent / "testdata" / "fonts" / "Arial-Black.ttf"
+    session = haforu.StreamingSession()
+    job = {
+        "id": "raw",
+        "font": {"path": str(font_path), "size": 64, "variations": {}},
+        "text": {"content": "a"},
+        "rendering": {"format": "pgm", "encoding": "base64", "width": 96, "height": 80},
+    }
+    meta, raw = session.render_raw(json.dumps(job))
+    assert meta["id"] == "raw"
+    assert (meta["width"], meta["height"], meta["stride"]) == (96, 80, 96)
+    assert isinstance(raw, bytes)
+
+    image = np.frombuffer(memoryview(raw), dtype=np.uint8).reshape(meta["height"], meta["stride"])
+    expected = session.render_to_numpy(str(font_path), "a", 64.0, 96, 80)
+    assert np.array_equal(image, expected)
+
+    with pytest.raises(ValueError):
+        session.render_raw("not json")
+
+
+def test_render_into_reuses_caller_buffer():
+    """render_into writes each render into the same preallocated buffer."""
+    try:
+        import haforu
+        import numpy as np
+    except ImportError:
+        pytest.skip("haforu or numpy not installed")
+
+    from pathlib import Path
+
+    font_path = Path(__file__).parent.parent.parent / "testdata" / "fonts" / "Arial-Black.ttf"
+    session = haforu.StreamingSession()
+    template = json.dumps(
+        {
+            "id": "into",
+            "font": {"path": str(font_path), "size": 64, "variations": {}},
+            "text": {"content": "__GLYPH__"},
+            "rendering": {"format": "pgm", "encoding": "base64", "width": 100, "height": 100},
+        }
+    )
+    buf = bytearray(10_000)
+    image = np.frombuffer(buf, dtype=np.uint8).reshape(100, 100)
+    for glyph in "aBMaBMaBMa":
+        meta = session.render_into(template.replace("__GLYPH__", glyph), buf)
+        assert (meta["width"], meta["height"]) == (100, 100)
+        expected = session.render_to_numpy(str(font_path), glyph, 64.0, 100, 100)
+        assert np.array_equal(image, expected)
+
+    with pytest.raises(ValueError):
+        session.render_into(template.replace("__GLYPH__", "a"), bytearray(99))
+    with pytest.raises(ValueError):
+        session.render_into(template.replace("__GLYPH__", "a"), bytes(10_000))
@@ -3,51 +3,88 @@
 """Tests for haforu streaming session Python bindings."""
 
 import json
+
 import pytest
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+haforu = pytest.importorskip("haforu", reason="haforu Python bindings not installed")
+
+if orjson is not None:
+
+    def _dumps(obj):
+        # The bindings take str, not the bytes orjson produces
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+_WARM_FONT = "testdata/fonts/Arial-Black.ttf"
+_WARM_GLYPHS = "aBM"
+
+
+@pytest.fixture(scope="module")
+def session():
+    """One warmed-up session shared by tests that do not reconfigure or close it.
+
+    The font and the metrics renders of ``_WARM_GLYPHS`` are cached up front,
+    so tests rendering those jobs start from cache hits.
+    """
+    shared = haforu.StreamingSession()
+    assert shared.warm_up(_WARM_FONT, ping=True)
+    template = _dumps(
+        {
+            "id": "warm",
+            "font": {"path": _WARM_FONT, "size": 256, "variations": {}},
+            "text": {"content": "__GLYPH__"},
+            "rendering": {"format": "metrics", "encoding": "json", "width": 96, "height": 96},
+        }
+    )
+    shared.render_batch([template.replace("__GLYPH__", glyph) for glyph in _WARM_GLYPHS])
+    yield shared
+    shared.close()
+
 
 def test_streaming_session_import():
     """Test that StreamingSession class can be imported."""
-    try:
-        import haforu
-        assert hasattr(haforu, "StreamingSession")
-    except ImportError:
-        pytest.skip("haforu Python bindings not installed")
+    assert hasattr(haforu, "StreamingSession")
 
 
 def test_streaming_session_creation():
     """Test that StreamingSession can be created."""
-    try:
-        import haforu
-    except ImportError:
-        pytest.skip("haforu Python bindings not installed")
-
     session = haforu.StreamingSession()
     assert session is not None
 
 
 def test_streaming_session_custom_cache_size():
     """Test that StreamingSession accepts custom cache size."""
-    try:
-        import haforu
-    except ImportError:
-        pytest.skip("haforu Python bindings not installed")
-
     session = haforu.StreamingSession(cache_size=1024)
     assert session is not None
 
 
 def test_streaming_session_cache_stats_and_resize():
     """StreamingSession exposes cache stats + resize knob."""
-    try:
-        import haforu
-    except ImportError:
-        pytest.skip("haforu Python bindings not installed")
-
     session = haforu.StreamingSession(cache_size=128)
     stats = session.cache_stats()
-    assert stats["capacity"] == 128
-    assert stats["glyph_capacity"] >= 1
+    assert isinstance(stats, haforu.CacheStats)
+    assert stats.capacity == 128
+    assert stats.glyph_capacity >= 1
+    # Item access is kept for callers of the former dict return value
+    assert stats["capacity"] == stats.capacity
+    assert stats.get("missing", -1) == -1
+    with pytest.raises(KeyError):
+        stats["missing"]
+    as_dict = dict(stats)
+    assert list(as_dict) == list(stats) == stats.keys()
+    assert len(stats) == len(as_dict)
+    assert list(as_dict.items()) == stats.items()
+    assert list(as_dict.values()) == stats.values()
 
     session.set_cache_size(64)
     resized = session.cache_stats()
@@ -55,16 +92,11 @@ def test_streaming_session_cache_stats_and_resize():
 
     session.set_glyph_cache_size(32)
     glyph_stats = session.cache_stats()
-    assert glyph_stats["glyph_capacity"] == 32
+    assert glyph_stats.glyph_capacity == 32
 
 
 def test_streaming_session_glyph_cache_reuses_results():
     """Identical glyph jobs should hit the glyph cache regardless of ID."""
-    try:
-        import haforu
-    except ImportError:
-        pytest.skip("haforu Python bindings not installed")
-
     session = haforu.StreamingSession(max_glyphs=2)
     job = {
         "id": "cache-a",
@@ -82,44 +114,34 @@ def test_streaming_session_glyph_cache_reuses_results():
         },
     }
 
-    first = json.loads(session.render(json.dumps(job)))
+    template = _dumps(job)
+    first = _loads(session.render(template))
     assert first["id"] == "cache-a"
 
-    job["id"] = "cache-b"
-    second = json.loads(session.render(json.dumps(job)))
+    second = _loads(session.render(template.replace('"cache-a"', '"cache-b"')))
     assert second["id"] == "cache-b"
 
     stats = session.cache_stats()
-    assert stats["glyph_entries"] == 1
-    assert stats.get("glyph_hits", 0) >= 1
+    assert stats.glyph_entries == 1
+    assert stats.glyph_hits >= 1
 
 
 def test_streaming_session_can_disable_glyph_cache():
     """Setting glyph cache size to zero should disable caching."""
-    try:
-        import haforu
-    except ImportError:
-        pytest.skip("haforu Python bindings not installed")
-
     session = haforu.StreamingSession(max_glyphs=0)
     stats = session.cache_stats()
-    assert stats["glyph_capacity"] == 0
+    assert stats.glyph_capacity == 0
     session.set_glyph_cache_size(0)
     disabled = session.cache_stats()
-    assert disabled["glyph_capacity"] == 0
+    assert disabled.glyph_capacity == 0
 
 
 def test_streaming_session_close():
     """Test that StreamingSession can be closed."""
-    try:
-        import haforu
-    except ImportError:
-        pytest.skip("haforu Python bindings not installed")
-
     session = haforu.StreamingSession()
     session.close()
     # Follow-up renders should raise RuntimeError once closed
-    job = json.dumps(
+    job = _dumps(
         {
             "id": "after-close",
             "font": {"path": "/nonexistent/font.ttf", "size": 1000, "variations": {}},
@@ -133,62 +155,51 @@ def test_streaming_session_close():
 
 def test_streaming_session_context_manager():
     """Test that StreamingSession works as context manager."""
-    try:
-        import haforu
-    except ImportError:
-        pytest.skip("haforu Python bindings not installed")
-
     with haforu.StreamingSession() as session:
         assert session is not None
     # Should not raise error on exit
 
 
-def test_streaming_session_render_method_exists():
-    """Test that StreamingSession has render method."""
-    try:
-        import haforu
-    except ImportError:
-        pytest.skip("haforu Python bindings not installed")
-
+def test_streaming_session_register_font_preloads_without_rendering():
+    """register_font caches the font so the first job skips loading it."""
     session = haforu.StreamingSession()
-    assert hasattr(session, "render")
-    assert hasattr(session, "warm_up")
-    assert hasattr(session, "ping")
+    session.register_font(_WARM_FONT)
+    stats = session.cache_stats()
+    assert (stats.font_entries, stats.glyph_entries) == (1, 0)
+    assert session.font_paths() == [_WARM_FONT]
 
+    result = session.render_dict(
+        {
+            "id": "registered",
+            "font": {"path": _WARM_FONT, "size": 256, "variations": {}},
+            "text": {"content": "a"},
+            "rendering": {"format": "metrics", "encoding": "json", "width": 64, "height": 64},
+        }
+    )
+    assert result["status"] == "success"
+    assert session.cache_stats().font_entries == 1
 
-def test_streaming_session_render_invalid_json():
-    """Invalid JSON should return JobResult error payload instead of raising."""
-    try:
-        import haforu
-    except ImportError:
-        pytest.skip("haforu Python bindings not installed")
+    with pytest.raises(RuntimeError):
+        session.register_font("/nonexistent/font.ttf")
 
-    session = haforu.StreamingSession()
-    payload = json.loads(session.render("not valid json"))
-    assert payload["status"] == "error"
-    assert "Invalid JSON" in payload["error"]
 
+def test_streaming_session_render_method_exists(session):
+    """Test that StreamingSession has render method."""
+    assert hasattr(session, "render")
+    assert hasattr(session, "warm_up")
+    assert hasattr(session, "ping")
 
-def test_streaming_session_warm_up_ping():
-    """warm_up should succeed without a font path."""
-    try:
-        import haforu
-    except ImportError:
-        pytest.skip("haforu Python bindings not installed")
 
-    session = haforu.StreamingSession()
+def test_streaming_session_warm_up_ping(session):
+    """warm_up should succeed without a font path, optionally pinging too."""
     assert session.warm_up() is True
     assert session.ping() is True
+    assert session.warm_up(ping=True) is True
 
 
-def test_streaming_session_render_single_job():
-    """Test that render processes a single job and returns JSONL."""
-    try:
-        import haforu
-    except ImportError:
-        pytest.skip("haforu Python bindings not installed")
-
-    session = haforu.StreamingSession()
+@pytest.mark.parametrize("wire", ["json", "msgpack"])
+def test_streaming_session_render_single_job(wire, session):
+    """Test that render processes a single job over either wire format."""
     job = {
         "id": "test1",
         "font": {
@@ -204,11 +215,12 @@ def test_streaming_session_render_single_job():
             "height": 100,
         },
     }
-    job_json = json.dumps(job)
-    result_json = session.render(job_json)
+    if wire == "msgpack":
+        msgpack = pytest.importorskip("msgpack")
+        result = msgpack.unpackb(session.render_msgpack(msgpack.packb(job)))
+    else:
+        result = session.render_dict(job)
 
-    # Parse result
-    result = json.loads(result_json)
     assert "id" in result
     assert result["id"] == "test1"
     assert "status" in result
@@ -217,22 +229,19 @@ def test_streaming_session_render_single_job():
     assert "timing" in result
 
 
-def test_streaming_session_multiple_renders():
-    """Test that session can handle multiple sequential renders."""
-    try:
-        import haforu
-    except ImportError:
-        pytest.skip("haforu Python bindings not installed")
-
+@pytest.mark.parametrize("batched", [False, True], ids=["render", "render_batch"])
+def test_streaming_session_multiple_renders(batched):
+    """Test that session can handle multiple renders, one call each or batched."""
     session = haforu.StreamingSession()
 
     # Render same job 10 times with a real font so glyphs are cached
     from pathlib import Path
     font_path = Path(__file__).parent.parent.parent / "testdata" / "fonts" / "Arial-Black.ttf"
 
-    for i in range(10):
-        job = {
-            "id": f"test{i}",
+    # Serialize once; only the id differs between the ten jobs
+    template = _dumps(
+        {
+            "id": "__ID__",
             "font": {
                 "path": str(font_path),
                 "size": 1000,
@@ -246,64 +255,28 @@ def test_streaming_session_multiple_renders():
                 "height": 100,
             },
         }
-        job_json = json.dumps(job)
-        result_json = session.render(job_json)
-        result = json.loads(result_json)
+    )
+    jobs = [template.replace("__ID__", f"test{i}") for i in range(10)]
+    if batched:
+        # One FFI crossing for all ten jobs
+        result_jsons = session.render_batch(jobs)
+    else:
+        result_jsons = [session.render(job_json) for job_json in jobs]
+
+    for i, result_json in enumerate(result_jsons):
+        result = _loads(result_json)
         assert result["id"] == f"test{i}"
         assert result["status"] == "success"
 
     glyph_stats = session.cache_stats()
     # Should have cached the single glyph 'a' after rendering it 10 times
-    assert glyph_stats["glyph_entries"] == 1
+    assert glyph_stats.glyph_entries == 1
 
 
-def test_streaming_session_result_format():
+def test_streaming_session_result_format(session):
     """Test that streaming session results match expected format."""
-    try:
-        import haforu
-    except ImportError:
-        pytest.skip("haforu Python bindings not installed")
-
-    with haforu.StreamingSession() as session:
-        job = {
-            "id": "test1",
-            "font": {
-                "path": "/nonexistent/font.ttf",
-                "size": 1000,
-                "variations": {},
-            },
-            "text": {"content": "a"},
-            "rendering": {
-                "format": "pgm",
-                "encoding": "base64",
-                "width": 100,
-                "height": 100,
-            },
-        }
-        result_json = session.render(json.dumps(job))
-        result = json.loads(result_json)
-
-        # Check required fields
-        assert "id" in result
-        assert "status" in result
-        assert "timing" in result
-
-        # Check timing structure
-        timing = result["timing"]
-        assert "total_ms" in timing
-        # Other timing fields may vary (render_ms, shape_ms, etc.)
-
-
-def test_streaming_session_error_handling():
-    """Test that streaming session handles errors gracefully."""
-    try:
-        import haforu
-    except ImportError:
-        pytest.skip("haforu Python bindings not installed")
-
-    session = haforu.StreamingSession()
     job = {
-        "id": "invalid-render",
+        "id": "test1",
         "font": {
             "path": "/nonexistent/font.ttf",
             "size": 1000,
@@ -313,24 +286,66 @@ def test_streaming_session_error_handling():
         "rendering": {
             "format": "pgm",
             "encoding": "base64",
-            "width": 0,  # invalid width should stay a JSON error
-            "height": 64,
+            "width": 100,
+            "height": 100,
         },
     }
-    result_json = session.render(json.dumps(job))
-    result = json.loads(result_json)
+    result = session.render_dict(job)
+
+    # Check required fields
+    assert "id" in result
+    assert "status" in result
+    assert "timing" in result
+
+    # Check timing structure
+    timing = result["timing"]
+    assert "total_ms" in timing
+    # Other timing fields may vary (render_ms, shape_ms, etc.)
+
+
+@pytest.mark.parametrize(
+    "job_json, expected_error",
+    [
+        ("not valid json", "Invalid JSON"),
+        (
+            _dumps(
+                {
+                    "id": "invalid-render",
+                    "font": {"path": "/nonexistent/font.ttf", "size": 1000, "variations": {}},
+                    "text": {"content": "a"},
+                    # invalid width should stay a JSON error
+                    "rendering": {"format": "pgm", "encoding": "base64", "width": 0, "height": 64},
+                }
+            ),
+            "Canvas",
+        ),
+        (
+            _dumps(
+                {
+                    "id": "missing-text",
+                    "font": {"path": "/nonexistent/font.ttf", "size": 1000},
+                    "rendering": {
+                        "format": "pgm",
+                        "encoding": "base64",
+                        "width": 100,
+                        "height": 100,
+                    },
+                }
+            ),
+            "",
+        ),
+    ],
+    ids=["invalid-json", "zero-width", "missing-text"],
+)
+def test_streaming_session_error_results(session, job_json, expected_error):
+    """Bad jobs come back as JobResult error payloads instead of raising."""
+    result = _loads(session.render(job_json))
     assert result["status"] == "error"
-    assert "Canvas" in result.get("error", "")
+    assert expected_error in result.get("error", "")
 
 
-def test_streaming_session_metrics_format_returns_metrics_payload():
+def test_streaming_session_metrics_format_returns_metrics_payload(session):
     """Streaming renders with format=metrics should omit rendering data."""
-    try:
-        import haforu
-    except ImportError:
-        pytest.skip("haforu Python bindings not installed")
-
-    session = haforu.StreamingSession()
     job = {
         "id": "metrics-stream",
         "font": {
@@ -346,7 +361,7 @@ def test_streaming_session_metrics_format_returns_metrics_payload():
             "height": 96,
         },
     }
-    result = json.loads(session.render(json.dumps(job)))
+    result = session.render_dict(job)
     assert result["status"] == "success"
     assert "metrics" in result
     assert "rendering" not in result
@@ -354,31 +369,88 @@ def test_streaming_session_metrics_format_returns_metrics_payload():
         assert 0.0 <= result["metrics"][key] <= 1.0, f"{key} out of range"
 
 
+def test_streaming_session_render_batch_preserves_order(session):
+    """render_batch returns one result per job, in input order."""
+    jobs = [
+        _dumps(
+            {
+                "id": f"batch-{glyph}",
+                "font": {
+                    "path": "testdata/fonts/Arial-Black.ttf",
+                    "size": 256,
+                    "variations": {},
+                },
+                "text": {"content": glyph},
+                "rendering": {
+                    "format": "metrics",
+                    "encoding": "json",
+                    "width": 64,
+                    "height": 64,
+                },
+            }
+        )
+        for glyph in "ABCD"
+    ]
+    results = [_loads(r) for r in session.render_batch(jobs + ["not json"])]
+    assert [r["id"] for r in results[:4]] == [f"batch-{glyph}" for glyph in "ABCD"]
+    assert all(r["status"] == "success" for r in results[:4])
+    assert results[4]["status"] == "error"
+
+
+def test_streaming_session_single_job_fastpath(session):
+    """A batch of one renders inline and returns exactly what render() does."""
+    job_json = _dumps(
+        {
+            "id": "single",
+            "font": {"path": _WARM_FONT, "size": 256, "variations": {}},
+            "text": {"content": "a"},
+            "rendering": {"format": "metrics", "encoding": "json", "width": 96, "height": 96},
+        }
+    )
+    results = session.render_batch([job_json])
+    assert len(results) == 1
+    batched = _loads(results[0])
+    single = _loads(session.render(job_json))
+    assert batched["id"] == single["id"] == "single"
+    assert batched["status"] == single["status"] == "success"
+    assert batched["metrics"] == single["metrics"]
+
+
+def test_streaming_session_batch_parallel():
+    """render_batch over distinct jobs matches a serial render() loop, in order."""
+    font_path = "testdata/fonts/Arial-Black.ttf"
+    jobs = [
+        _dumps(
+            {
+                "id": f"par-{i}",
+                "font": {"path": font_path, "size": 512, "variations": {}},
+                # Distinct text per job so the glyph cache cannot help
+                "text": {"content": f"{chr(0x41 + i % 26)}{i}"},
+                "rendering": {
+                    "format": "metrics",
+                    "encoding": "json",
+                    "width": 256,
+                    "height": 256,
+                },
+            }
+        )
+        for i in range(64)
+    ]
+
+    with haforu.StreamingSession() as serial, haforu.StreamingSession() as batched:
+        serial.warm_up(font_path)
+        batched.warm_up(font_path)
+
+        serial_results = [serial.render(job) for job in jobs]
+        batch_results = batched.render_batch(jobs)
+
+    assert all(_loads(r)["status"] == "success" for r in batch_results)
+    assert [_loads(r)["id"] for r in batch_results] == [
+        _loads(r)["id"] for r in serial_results
+    ]
+
+
 def test_haforu_module_is_available_probe():
     """Module-level availability probe should be fast and boolean."""
-    try:
-        import haforu
-    except ImportError:
-        pytest.skip("haforu Python bindings not installed")
-
     available = haforu.is_available()
     assert isinstance(available, bool)
-
-    session = haforu.StreamingSession()
-
-    # Test with missing required field
-    job = {
-        "id": "test1",
-        "font": {"path": "/nonexistent/font.ttf", "size": 1000},
-        # Missing text field
-        "rendering": {
-            "format": "pgm",
-            "encoding": "base64",
-            "width": 100,
-            "height": 100,
-        },
-    }
-
-    session = haforu.StreamingSession()
-    result = json.loads(session.render(json.dumps(job)))
-    assert result["status"] == "error"
@@ -125,6 +125,10 @@ pub struct MetricsOutput {
     pub density: f64,
     /// Longest contiguous non-zero run relative to canvas size [0.0, 1.0]
     pub beam: f64,
+    /// Fraction of non-zero pixels [0.0, 1.0]
+    pub coverage: f64,
+    /// Tight bounding box of non-zero pixels (x, y, w, h); zeros when blank
+    pub bbox: (u32, u32, u32, u32),
 }
 
 /// Timing statistics for a job.
@@ -469,6 +473,8 @@ mod tests {
             metrics: Some(MetricsOutput {
                 density: 0.42,
                 beam: 0.15,
+                coverage: 0.5,
+                bbox: (1, 2, 3, 4),
             }),
             error: None,
             font: None,
@@ -478,6 +484,7 @@ mod tests {
 
         let json = serde_json::to_string(&result).unwrap();
         assert!(json.contains("\"metrics\""), "JSON: {json}");
+        assert!(json.contains("\"bbox\":[1,2,3,4]"), "JSON: {json}");
         assert!(
             !json.contains("\"rendering\""),
             "JSON should omit rendering"
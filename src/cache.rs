@@ -6,6 +6,9 @@
 //! bypass shaping and rasterization. It is intentionally small and simple — an
 //! `lru` map guarded by a mutex — because the access pattern is dominated by
 //! fontsimi’s single-glyph probes.
+//!
+//! `LruCache::new` hashes keys with hashbrown's default hasher (foldhash), not
+//! std's SipHash, so lookups already use a fast non-cryptographic hash.
 
 use crate::JobPayload;
 use lru::LruCache;
@@ -38,9 +41,14 @@ pub(crate) struct GlyphCacheStats {
 }
 
 /// Shared glyph cache (LRU).
+///
+/// Payloads are stored behind `Arc` so the mutex is only held for the LRU
+/// bookkeeping and a refcount bump; copying a (possibly large) base64 payload
+/// happens after the lock is released, which keeps parallel batch renders
+/// from serializing on cache hits.
 #[derive(Clone, Debug)]
 pub(crate) struct GlyphCache {
-    inner: Arc<Mutex<Option<LruCache<GlyphCacheKey, JobPayload>>>>,
+    inner: Arc<Mutex<Option<LruCache<GlyphCacheKey, Arc<JobPayload>>>>>,
     hits: Arc<AtomicU64>,
 }
 
@@ -55,18 +63,19 @@ impl GlyphCache {
 
     /// Retrieve a cached payload if present.
     pub(crate) fn get(&self, key: &GlyphCacheKey) -> Option<JobPayload> {
-        let mut guard = self.inner.lock().expect("glyph cache mutex poisoned");
-        guard
-            .as_mut()
-            .and_then(|cache| cache.get(key).cloned())
-            .map(|payload| {
-                self.hits.fetch_add(1, Ordering::Relaxed);
-                payload
-            })
+        let cached = {
+            let mut guard = self.inner.lock().expect("glyph cache mutex poisoned");
+            guard.as_mut().and_then(|cache| cache.get(key).cloned())
+        };
+        cached.map(|payload| {
+            self.hits.fetch_add(1, Ordering::Relaxed);
+            JobPayload::clone(&payload)
+        })
     }
 
     /// Insert a payload into the cache.
     pub(crate) fn insert(&self, key: GlyphCacheKey, payload: JobPayload) {
+        let payload = Arc::new(payload);
         if let Some(cache) = self
             .inner
             .lock()
@@ -125,7 +134,7 @@ impl GlyphCache {
 #[cfg(test)]
 mod tests {
     use super::*;
-    use crate::batch::RenderingOutput;
+    use crate::batch::{MetricsOutput, RenderingOutput};
 
     #[test]
     fn glyph_cache_stores_and_retrieves_payloads() {
@@ -189,4 +198,38 @@ mod tests {
         );
         assert!(cache.get(&key).is_none(), "cache disabled should miss");
     }
+
+    #[test]
+    fn glyph_cache_counts_hits_across_many_keys() {
+        let cache = GlyphCache::new(1000).expect("cache enabled");
+        let key_for = |glyph: char| GlyphCacheKey {
+            font_path: "font".into(),
+            font_size: 256,
+            width: 64,
+            height: 64,
+            format: "metrics".into(),
+            encoding: "json".into(),
+            text: glyph.to_string(),
+            script: None,
+            variations: SmallVec::new(),
+        };
+        let glyphs: Vec<char> = (0x4E00..0x4E00 + 1000).filter_map(char::from_u32).collect();
+        for &glyph in &glyphs {
+            assert!(cache.get(&key_for(glyph)).is_none());
+            let metrics = MetricsOutput {
+                density: 0.5,
+                beam: 0.5,
+                coverage: 0.5,
+                bbox: (0, 0, 64, 64),
+            };
+            cache.insert(key_for(glyph), JobPayload::Metrics(metrics));
+        }
+        assert_eq!(cache.stats().hits, 0, "misses must not count as hits");
+        assert_eq!(cache.stats().entries, 1000);
+
+        for &glyph in &glyphs {
+            assert!(cache.get(&key_for(glyph)).is_some());
+        }
+        assert_eq!(cache.stats().hits, 1000);
+    }
 }
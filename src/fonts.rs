@@ -22,10 +22,15 @@ use std::sync::{Arc, Mutex};
 /// Memory-mapped font with metadata and instance cache.
 pub struct FontLoader {
     cache: Arc<DashMap<FontCacheKey, Arc<FontInstance>>>,
+    /// Variation axes of every font parsed so far, keyed by path
+    axes: Arc<DashMap<String, Arc<FontAxes>>>,
     max_capacity: usize,
     current_size: Arc<AtomicUsize>,
 }
 
+/// Variation axes of a font: tag -> (min, default, max).
+type FontAxes = HashMap<String, (f32, f32, f32)>;
+
 /// Font cache statistics for observability.
 #[derive(Debug, Clone, Copy)]
 pub struct CacheStats {
@@ -55,12 +60,31 @@ struct FontCacheKey {
     coordinates: Vec<(String, u32)>, // (axis, f32 as bits)
 }
 
+impl FontCacheKey {
+    /// Build a key whose coordinates are sorted by axis tag.
+    ///
+    /// `HashMap` iteration order differs between maps holding the same
+    /// entries, so unsorted keys would miss the cache for multi-axis locations.
+    fn new(path: &Utf8Path, coordinates: &HashMap<String, f32>) -> Self {
+        let mut coords: Vec<(String, u32)> = coordinates
+            .iter()
+            .map(|(k, v)| (k.clone(), v.to_bits()))
+            .collect();
+        coords.sort_unstable_by(|a, b| a.0.cmp(&b.0));
+        Self {
+            path: path.to_string(),
+            coordinates: coords,
+        }
+    }
+}
+
 impl FontLoader {
     /// Create a new font loader with specified cache size.
     pub fn new(cache_size: usize) -> Self {
         let cache_size = cache_size.max(1);
         Self {
             cache: Arc::new(DashMap::with_capacity(cache_size)),
+            axes: Arc::new(DashMap::new()),
             max_capacity: cache_size,
             current_size: Arc::new(AtomicUsize::new(0)),
         }
@@ -69,27 +93,50 @@ impl FontLoader {
     /// Load a font and apply variable font coordinates.
     ///
     /// Returns a cached instance if available, otherwise loads from disk.
+    ///
+    /// The cache is keyed on the clamped coordinates an instance is built
+    /// with, so `{}`, default-location coordinates and values that clamp to
+    /// the same location all share one instance.
     pub fn load_font(
         &self,
         path: &Utf8Path,
         coordinates: &HashMap<String, f32>,
     ) -> Result<Arc<FontInstance>> {
-        // Build cache key
-        let cache_key = FontCacheKey {
-            path: path.to_string(),
-            coordinates: coordinates
-                .iter()
-                .map(|(k, v)| (k.clone(), v.to_bits()))
-                .collect(),
+        // Empty coordinates need no clamping; otherwise clamp against the
+        // axes remembered from an earlier load of this path, if any.
+        let known_axes = if coordinates.is_empty() {
+            None
+        } else {
+            self.axes
+                .get(path.as_str())
+                .map(|axes| Arc::clone(axes.value()))
+        };
+        let lookup_key = match known_axes {
+            Some(axes) => Some(FontCacheKey::new(
+                path,
+                &Self::clamp_coordinates(&axes, path.as_std_path(), coordinates, false),
+            )),
+            None if coordinates.is_empty() => Some(FontCacheKey::new(path, coordinates)),
+            None => None,
         };
 
         // Fast path: check cache with lock-free read
-        if let Some(instance) = self.cache.get(&cache_key) {
+        if let Some(instance) = lookup_key.and_then(|key| self.cache.get(&key)) {
             return Ok(Arc::clone(instance.value()));
         }
 
         // Slow path: load from disk
         let instance = Self::load_font_impl(path, coordinates)?;
+        self.axes
+            .entry(path.to_string())
+            .or_insert_with(|| Arc::new(Self::font_axes(&instance.font_ref)));
+
+        // The first load of a path cannot clamp before parsing, so the
+        // resolved location may already be cached
+        let cache_key = FontCacheKey::new(path, &instance.coordinates);
+        if let Some(cached) = self.cache.get(&cache_key) {
+            return Ok(Arc::clone(cached.value()));
+        }
         let instance = Arc::new(instance);
 
         // Store in cache with simple size-based eviction
@@ -110,6 +157,7 @@ impl FontLoader {
     /// Clear all cached font instances.
     pub fn clear(&self) {
         self.cache.clear();
+        self.axes.clear();
         self.current_size.store(0, Ordering::Relaxed);
     }
 
@@ -199,9 +247,17 @@ impl FontLoader {
         path: &Path,
         coordinates: &HashMap<String, f32>,
     ) -> Result<HashMap<String, f32>> {
-        // Extract available axes from font
-        let axes: HashMap<String, (f32, f32, f32)> = font
-            .axes()
+        Ok(Self::clamp_coordinates(
+            &Self::font_axes(font),
+            path,
+            coordinates,
+            true,
+        ))
+    }
+
+    /// Extract the variation axes of a font.
+    fn font_axes(font: &FontRef) -> FontAxes {
+        font.axes()
             .iter()
             .map(|axis| {
                 let tag = axis.tag().to_string();
@@ -210,23 +266,34 @@ impl FontLoader {
                     (axis.min_value(), axis.default_value(), axis.max_value()),
                 )
             })
-            .collect();
+            .collect()
+    }
 
+    /// Clamp coordinates to `axes`, dropping unknown axes and default values.
+    ///
+    /// `log_changes` reports clamped and dropped coordinates; cache lookups
+    /// pass `false` so only the load that builds an instance logs them.
+    fn clamp_coordinates(
+        axes: &FontAxes,
+        path: &Path,
+        coordinates: &HashMap<String, f32>,
+        log_changes: bool,
+    ) -> HashMap<String, f32> {
         if axes.is_empty() {
             // Static font - ignore all coordinates
-            if !coordinates.is_empty() {
+            if log_changes && !coordinates.is_empty() {
                 log::warn!(
                     "Font {} is static but coordinates provided - ignoring",
                     path.display()
                 );
             }
-            return Ok(HashMap::new());
+            return HashMap::new();
         }
 
         // Validate and clamp each coordinate
         let mut clamped = HashMap::new();
         for (axis, value) in coordinates {
-            if let Some((min, _default, max)) = axes.get(axis) {
+            if let Some((min, default, max)) = axes.get(axis) {
                 // Prefer font-provided bounds, but apply well-known sane clamps
                 // for common axes as an additional safeguard.
                 let (hard_min, hard_max) = match axis.as_str() {
@@ -239,7 +306,7 @@ impl FontLoader {
                 let eff_min = hard_min.max(*min);
                 let eff_max = hard_max.min(*max);
                 let clamped_value = value.clamp(eff_min, eff_max);
-                if (clamped_value - value).abs() > 0.001 {
+                if log_changes && (clamped_value - value).abs() > 0.001 {
                     log::warn!(
                         "Coordinate for axis '{}' clamped from {} to {} (bounds: [{}, {}], hard: [{}, {}])",
                         axis,
@@ -251,19 +318,33 @@ impl FontLoader {
                         hard_max
                     );
                 }
+                if clamped_value == *default {
+                    // The default location needs no variation work at all: an
+                    // empty map keeps shaping/rendering on the static fast paths.
+                    if log_changes {
+                        log::debug!(
+                            "Coordinate for axis '{}' is at its default {} — eliding",
+                            axis,
+                            default
+                        );
+                    }
+                    continue;
+                }
                 clamped.insert(axis.clone(), clamped_value);
             } else {
                 // Axis not present in this font: warn-and-drop per integration contract.
-                log::warn!(
-                    "Unknown variation axis '{}' for font {} — dropping coordinate",
-                    axis,
-                    path.display()
-                );
+                if log_changes {
+                    log::warn!(
+                        "Unknown variation axis '{}' for font {} — dropping coordinate",
+                        axis,
+                        path.display()
+                    );
+                }
                 // Intentionally do not include this axis in the resulting map.
             }
         }
 
-        Ok(clamped)
+        clamped
     }
 
     /// Create a HarfBuzz font from memory-mapped data with variations applied.
@@ -305,6 +386,47 @@ impl FontLoader {
     pub fn cache_stats(&self) -> (usize, usize) {
         (self.cache.len(), self.max_capacity)
     }
+
+    /// Distinct font paths with at least one cached instance, sorted.
+    pub fn cached_paths(&self) -> Vec<String> {
+        let mut paths: Vec<String> = self
+            .cache
+            .iter()
+            .map(|entry| entry.key().path.clone())
+            .collect();
+        paths.sort_unstable();
+        paths.dedup();
+        paths
+    }
+
+    /// Cached instances as (path, applied coordinates) pairs, sorted by path.
+    ///
+    /// Coordinates are the clamped ones the instance was built with, so
+    /// requests that resolved to the same location are listed once.
+    pub fn cached_instances(&self) -> Vec<(String, HashMap<String, f32>)> {
+        let mut keys: Vec<FontCacheKey> = self
+            .cache
+            .iter()
+            .map(|entry| {
+                FontCacheKey::new(
+                    Utf8Path::new(&entry.key().path),
+                    entry.value().coordinates(),
+                )
+            })
+            .collect();
+        keys.sort_unstable_by(|a, b| (&a.path, &a.coordinates).cmp(&(&b.path, &b.coordinates)));
+        keys.dedup();
+        keys.into_iter()
+            .map(|key| {
+                let coords = key
+                    .coordinates
+                    .into_iter()
+                    .map(|(axis, bits)| (axis, f32::from_bits(bits)))
+                    .collect();
+                (key.path, coords)
+            })
+            .collect()
+    }
 }
 
 impl FontInstance {
@@ -382,6 +504,37 @@ mod tests {
         assert_ne!(key1, key2);
     }
 
+    #[test]
+    fn cache_key_ignores_coordinate_insertion_order() {
+        let path = camino::Utf8Path::new("font.ttf");
+        let mut first = HashMap::new();
+        first.insert("wght".to_string(), 600.0);
+        first.insert("wdth".to_string(), 80.0);
+        first.insert("opsz".to_string(), 12.0);
+        let mut second = HashMap::new();
+        second.insert("opsz".to_string(), 12.0);
+        second.insert("wdth".to_string(), 80.0);
+        second.insert("wght".to_string(), 600.0);
+        assert_eq!(
+            FontCacheKey::new(path, &first),
+            FontCacheKey::new(path, &second)
+        );
+    }
+
+    #[test]
+    fn repeated_variable_location_reuses_cached_instance() {
+        let loader = FontLoader::new(8);
+        let font_path = camino::Utf8PathBuf::from("testdata/fonts/IBMPlexSans-VF.ttf");
+        let mut coords = HashMap::new();
+        coords.insert("wght".to_string(), 600.0);
+        coords.insert("wdth".to_string(), 90.0);
+        let first = loader.load_font(&font_path, &coords).expect("font loads");
+        let again: HashMap<String, f32> = coords.clone().into_iter().rev().collect();
+        let second = loader.load_font(&font_path, &again).expect("font loads");
+        assert!(Arc::ptr_eq(&first, &second));
+        assert_eq!(loader.stats().entries, 1);
+    }
+
     #[test]
     fn load_static_font_drops_unknown_axes() {
         // Arial-Black.ttf in testdata is a static font; any coordinates should be ignored.
@@ -451,6 +604,62 @@ mod tests {
         );
     }
 
+    #[test]
+    fn default_coordinates_are_elided() {
+        let loader = FontLoader::new(16);
+        let font_path = camino::Utf8PathBuf::from("testdata/fonts/IBMPlexSans-VF.ttf");
+        let probe = loader
+            .load_font(&font_path, &HashMap::new())
+            .expect("variable font should load");
+        let defaults: HashMap<String, f32> = probe
+            .font_ref()
+            .axes()
+            .iter()
+            .map(|axis| (axis.tag().to_string(), axis.default_value()))
+            .collect();
+        assert!(!defaults.is_empty(), "test font must be variable");
+
+        let inst = loader
+            .load_font(&font_path, &defaults)
+            .expect("variable font should load at its default location");
+        assert!(
+            inst.coordinates().is_empty(),
+            "default-location coordinates should be dropped: {:?}",
+            inst.coordinates()
+        );
+    }
+
+    #[test]
+    fn equivalent_locations_share_one_instance() {
+        let loader = FontLoader::new(16);
+        let font_path = camino::Utf8PathBuf::from("testdata/fonts/IBMPlexSans-VF.ttf");
+        let base = loader
+            .load_font(&font_path, &HashMap::new())
+            .expect("variable font should load");
+        let mut defaults: HashMap<String, f32> = base
+            .font_ref()
+            .axes()
+            .iter()
+            .map(|axis| (axis.tag().to_string(), axis.default_value()))
+            .collect();
+        defaults.insert("ZZZZ".to_string(), 12.34);
+        let at_default = loader
+            .load_font(&font_path, &defaults)
+            .expect("variable font should load");
+        assert!(Arc::ptr_eq(&base, &at_default));
+
+        let mut heaviest = HashMap::new();
+        heaviest.insert("wght".to_string(), 2500.0);
+        let clamped = loader
+            .load_font(&font_path, &heaviest)
+            .expect("variable font should load");
+        let again = loader
+            .load_font(&font_path, clamped.coordinates())
+            .expect("variable font should load");
+        assert!(Arc::ptr_eq(&clamped, &again));
+        assert_eq!(loader.stats().entries, 2);
+    }
+
     #[test]
     fn location_reports_sanitized_coordinates() {
         let loader = FontLoader::new(16);
@@ -473,4 +682,46 @@ mod tests {
             "Streaming to skrifa must use sanitized values"
         );
     }
+
+    #[test]
+    fn cached_paths_lists_each_font_once() {
+        let loader = FontLoader::new(16);
+        let font_path = camino::Utf8PathBuf::from("testdata/fonts/IBMPlexSans-VF.ttf");
+        let mut coords = HashMap::new();
+        loader
+            .load_font(&font_path, &coords)
+            .expect("variable font should load");
+        coords.insert("wght".to_string(), 700.0);
+        loader
+            .load_font(&font_path, &coords)
+            .expect("variable font should load");
+
+        assert_eq!(loader.cached_paths(), vec![font_path.to_string()]);
+        loader.clear();
+        assert!(loader.cached_paths().is_empty());
+    }
+
+    #[test]
+    fn cached_instances_keep_their_coordinates() {
+        let loader = FontLoader::new(16);
+        let font_path = camino::Utf8PathBuf::from("testdata/fonts/IBMPlexSans-VF.ttf");
+        let mut coords = HashMap::new();
+        loader
+            .load_font(&font_path, &coords)
+            .expect("variable font should load");
+        coords.insert("wght".to_string(), 700.0);
+        loader
+            .load_font(&font_path, &coords)
+            .expect("variable font should load");
+
+        let mut instances = loader.cached_instances();
+        instances.sort_by_key(|(_, coords)| coords.len());
+        assert_eq!(
+            instances,
+            vec![
+                (font_path.to_string(), HashMap::new()),
+                (font_path.to_string(), coords),
+            ]
+        );
+    }
 }
@@ -224,10 +224,13 @@ pub fn process_job_with_options(
             if let Some(ref guard) = timeout_guard {
                 guard.check("render")?;
             }
+            let (density, inked, bbox) = image.density_coverage_and_bbox();
             return Ok((
                 JobPayload::Metrics(MetricsOutput {
-                    density: image.density(),
+                    density,
                     beam: image.beam(),
+                    coverage: inked as f64 / image.pixels().len() as f64,
+                    bbox,
                 }),
                 cache_key,
                 false,
@@ -505,6 +508,13 @@ mod tests {
             "beam should be normalized: {}",
             metrics.beam
         );
+        assert!(
+            metrics.coverage > 0.0 && metrics.coverage <= 1.0,
+            "coverage should be normalized: {}",
+            metrics.coverage
+        );
+        let (_, _, bbox_w, bbox_h) = metrics.bbox;
+        assert!(bbox_w > 0 && bbox_w <= 64 && bbox_h > 0 && bbox_h <= 64);
     }
 
     #[test]
@@ -27,6 +27,8 @@ mod input;
 const DEFAULT_MAX_FONTS: usize = 512;
 const DEFAULT_MAX_GLYPHS: usize = 2048;
 const STATS_PREFIX: &str = "HAFORU_STATS";
+/// Buffer size for streamed JSONL input and result output.
+const IO_BUFFER_BYTES: usize = 64 * 1024;
 
 /// Haforu: High-performance batch font renderer
 #[derive(Parser)]
@@ -496,14 +498,17 @@ fn run_streaming_mode(
 
     let font_loader = FontLoader::new(max_fonts);
 
-    let stdin = io::stdin();
-    let stdout = io::stdout();
-    let mut stdout_handle = stdout.lock();
+    let mut reader = io::BufReader::with_capacity(IO_BUFFER_BYTES, io::stdin().lock());
+    let mut out = io::BufWriter::with_capacity(IO_BUFFER_BYTES, io::stdout().lock());
     let mut counters = StreamCounters::default();
     let started = Instant::now();
+    let mut line = String::new();
 
-    for (line_no, line) in stdin.lock().lines().enumerate() {
-        let line = line?;
+    for line_no in 0.. {
+        line.clear();
+        if reader.read_line(&mut line)? == 0 {
+            break;
+        }
 
         if let Some(result) = handle_stream_line(&line, line_no, &font_loader, opts) {
             counters.processed += 1;
@@ -512,15 +517,22 @@ fn run_streaming_mode(
             } else {
                 counters.errors += 1;
             }
-            let json = serde_json::to_string(&result)?;
-            writeln!(stdout_handle, "{}", json)?;
-            stdout_handle.flush()?;
+            serde_json::to_writer(&mut out, &result)?;
+            out.write_all(b"\n")?;
 
             if result.status == "success" {
                 log::debug!("Processed job {} (id={})", line_no + 1, result.id);
             }
         }
+
+        // Flush only once the jobs already read are answered: an interactive
+        // caller still gets each result before we block on the next line,
+        // while a piped burst shares one write(2) instead of one per result.
+        if reader.buffer().is_empty() {
+            out.flush()?;
+        }
     }
+    out.flush()?;
 
     let elapsed = started.elapsed();
     log::info!(
@@ -616,12 +628,16 @@ fn process_jobs_parallel(
     let (tx, rx) = mpsc::channel();
 
     let output_handle = std::thread::spawn(move || {
-        let stdout = io::stdout();
-        let mut handle = stdout.lock();
-        for result in rx {
-            let json = serde_json::to_string(&result).expect("Failed to serialize result");
-            writeln!(handle, "{}", json).expect("Failed to write to stdout");
-            handle.flush().expect("Failed to flush stdout");
+        // Group commit: write every result already queued, then flush once, so
+        // a burst of finished jobs costs one write(2) while a lone result is
+        // still flushed as soon as it arrives.
+        let mut out = io::BufWriter::with_capacity(IO_BUFFER_BYTES, io::stdout().lock());
+        while let Ok(first) = rx.recv() {
+            for result in std::iter::once(first).chain(rx.try_iter()) {
+                serde_json::to_writer(&mut out, &result).expect("Failed to serialize result");
+                out.write_all(b"\n").expect("Failed to write to stdout");
+            }
+            out.flush().expect("Failed to flush stdout");
         }
     });
 
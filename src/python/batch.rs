@@ -7,9 +7,10 @@
 
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
 use rayon::prelude::*;
 use std::sync::mpsc;
-use std::sync::Arc;
+use std::sync::{Arc, Mutex};
 use std::thread;
 
 use crate::batch::{JobResult, JobSpec};
@@ -22,6 +23,8 @@ use camino::Utf8PathBuf;
 /// # Arguments
 ///
 /// * `spec_json` - JSON string containing JobSpec with jobs array
+/// * `force_format` - Optional rendering format applied to every job (e.g.
+///   `"metrics"`), so callers need not rewrite the spec before sending it
 ///
 /// # Returns
 ///
@@ -55,13 +58,14 @@ use camino::Utf8PathBuf;
 const DEFAULT_MAX_FONTS: usize = 512;
 const DEFAULT_MAX_GLYPHS: usize = 2048;
 
-#[pyfunction(signature = (spec_json, *, max_fonts=None, max_glyphs=None, timeout_ms=None, base_dir=None))]
+#[pyfunction(signature = (spec_json, *, max_fonts=None, max_glyphs=None, timeout_ms=None, base_dir=None, force_format=None))]
 pub fn process_jobs(
     spec_json: &str,
     max_fonts: Option<usize>,
     max_glyphs: Option<usize>,
     timeout_ms: Option<u64>,
     base_dir: Option<&str>,
+    force_format: Option<&str>,
 ) -> PyResult<ProcessJobsIterator> {
     // First, parse into generic JSON to validate top-level fields without requiring full schema.
     let v: serde_json::Value = serde_json::from_str(spec_json)
@@ -81,7 +85,7 @@ pub fn process_jobs(
     }
 
     // Now strictly deserialize into JobSpec to validate structure.
-    let spec: JobSpec = serde_json::from_value(v)
+    let mut spec: JobSpec = serde_json::from_value(v)
         .map_err(|e| PyValueError::new_err(format!("Invalid JSON: {}", e)))?;
 
     // Validate jobs
@@ -89,6 +93,12 @@ pub fn process_jobs(
         return Err(PyValueError::new_err("Job list is empty"));
     }
 
+    if let Some(format) = force_format {
+        for job in &mut spec.jobs {
+            job.rendering.format = format.to_string();
+        }
+    }
+
     let mut opts = ExecutionOptions::default();
     if let Some(ms) = timeout_ms {
         opts.timeout_ms = Some(ms);
@@ -106,13 +116,57 @@ pub fn process_jobs(
     Ok(ProcessJobsIterator::new(spec, font_capacity, opts))
 }
 
+/// Process a batch of rendering jobs, yielding results in JSONL chunks.
+///
+/// Same arguments and validation as `process_jobs`, but each iteration returns
+/// one `bytes` object holding up to `batch_size` newline-terminated JSON
+/// results. Results that are already finished are drained together, so the
+/// Python↔Rust crossing and result allocation happen once per chunk instead
+/// of once per job. Serialized results never contain raw newlines, so
+/// `chunk.splitlines()` recovers the individual records.
+///
+/// # Example
+///
+/// ```python
+/// for chunk in haforu.process_jobs_buffered(json.dumps(spec), batch_size=64):
+///     for line in chunk.splitlines():
+///         result = json.loads(line)
+/// ```
+#[pyfunction(signature = (spec_json, *, batch_size=64, max_fonts=None, max_glyphs=None, timeout_ms=None, base_dir=None, force_format=None))]
+pub fn process_jobs_buffered(
+    spec_json: &str,
+    batch_size: usize,
+    max_fonts: Option<usize>,
+    max_glyphs: Option<usize>,
+    timeout_ms: Option<u64>,
+    base_dir: Option<&str>,
+    force_format: Option<&str>,
+) -> PyResult<ProcessJobsChunkIterator> {
+    if batch_size == 0 {
+        return Err(PyValueError::new_err("batch_size must be >= 1"));
+    }
+    let inner = process_jobs(
+        spec_json,
+        max_fonts,
+        max_glyphs,
+        timeout_ms,
+        base_dir,
+        force_format,
+    )?;
+    Ok(ProcessJobsChunkIterator { inner, batch_size })
+}
+
 /// Iterator that processes jobs in parallel and yields results.
 ///
 /// Uses a background thread with rayon for parallel processing.
-/// Results are sent via a channel and yielded as they complete.
+/// Results are sent via a channel and yielded as they complete. The GIL is
+/// released while waiting, so Python threads (e.g. NumPy analysis of earlier
+/// results) keep running while the next render finishes.
 #[pyclass]
 pub struct ProcessJobsIterator {
-    receiver: mpsc::Receiver<String>,
+    // Mutex makes the receiver shareable with `allow_threads`; only one
+    // consumer ever locks it.
+    receiver: Mutex<mpsc::Receiver<String>>,
     #[allow(dead_code)]
     handle: Option<thread::JoinHandle<()>>,
 }
@@ -160,7 +214,7 @@ impl ProcessJobsIterator {
         });
 
         Self {
-            receiver: rx,
+            receiver: Mutex::new(rx),
             handle: Some(handle),
         }
     }
@@ -172,8 +226,46 @@ impl ProcessJobsIterator {
         slf
     }
 
-    fn __next__(&mut self) -> Option<String> {
-        self.receiver.recv().ok()
+    fn __next__(&mut self, py: Python<'_>) -> Option<String> {
+        let receiver = &self.receiver;
+        py.allow_threads(|| receiver.lock().ok()?.recv().ok())
+    }
+}
+
+/// Iterator yielding completed results as JSONL `bytes` chunks.
+#[pyclass]
+#[derive(Debug)]
+pub struct ProcessJobsChunkIterator {
+    inner: ProcessJobsIterator,
+    batch_size: usize,
+}
+
+impl ProcessJobsChunkIterator {
+    /// Block for the next result, then drain up to `batch_size - 1` more that are ready.
+    fn next_chunk(&self) -> Option<Vec<u8>> {
+        let receiver = self.inner.receiver.lock().ok()?;
+        let first = receiver.recv().ok()?;
+        let mut chunk = Vec::with_capacity((first.len() + 1) * self.batch_size.min(8));
+        chunk.extend_from_slice(first.as_bytes());
+        chunk.push(b'\n');
+        for line in receiver.try_iter().take(self.batch_size - 1) {
+            chunk.extend_from_slice(line.as_bytes());
+            chunk.push(b'\n');
+        }
+        Some(chunk)
+    }
+}
+
+#[pymethods]
+impl ProcessJobsChunkIterator {
+    fn __iter__(slf: PyRef<Self>) -> PyRef<Self> {
+        slf
+    }
+
+    fn __next__<'py>(&mut self, py: Python<'py>) -> Option<Bound<'py, PyBytes>> {
+        let this = &*self;
+        py.allow_threads(|| this.next_chunk())
+            .map(|chunk| PyBytes::new_bound(py, &chunk))
     }
 }
 
@@ -184,7 +276,7 @@ mod tests {
     #[test]
     fn test_process_jobs_empty() {
         let spec_json = r#"{"version": "1.0", "jobs": []}"#;
-        let result = process_jobs(spec_json, None, None, None, None);
+        let result = process_jobs(spec_json, None, None, None, None, None);
         assert!(result.is_err());
         assert!(result.unwrap_err().to_string().contains("empty"));
     }
@@ -192,7 +284,7 @@ mod tests {
     #[test]
     fn test_process_jobs_invalid_json() {
         let spec_json = "not valid json";
-        let result = process_jobs(spec_json, None, None, None, None);
+        let result = process_jobs(spec_json, None, None, None, None, None);
         assert!(result.is_err());
         assert!(result.unwrap_err().to_string().contains("Invalid JSON"));
     }
@@ -200,7 +292,7 @@ mod tests {
     #[test]
     fn test_process_jobs_invalid_version() {
         let spec_json = r#"{"version": "2.0", "jobs": [{"id": "test"}]}"#;
-        let result = process_jobs(spec_json, None, None, None, None);
+        let result = process_jobs(spec_json, None, None, None, None, None);
         assert!(result.is_err());
         assert!(result
             .unwrap_err()
@@ -208,6 +300,64 @@ mod tests {
             .contains("Unsupported version"));
     }
 
+    #[test]
+    fn process_jobs_buffered_rejects_zero_batch_size() {
+        let spec_json = r#"{"version": "1.0", "jobs": []}"#;
+        let result = process_jobs_buffered(spec_json, 0, None, None, None, None, None);
+        assert!(result.unwrap_err().to_string().contains("batch_size"));
+    }
+
+    #[test]
+    fn process_jobs_buffered_chunks_all_results() {
+        let job = r#"{
+            "id": "ID",
+            "font": {"path": "/nonexistent/font.ttf", "size": 1000, "variations": {}},
+            "text": {"content": "A"},
+            "rendering": {"format": "metrics", "encoding": "json", "width": 32, "height": 32}
+        }"#;
+        let jobs: Vec<String> = (0..5)
+            .map(|i| job.replace("ID", &format!("job-{i}")))
+            .collect();
+        let spec_json = format!(r#"{{"version": "1.0", "jobs": [{}]}}"#, jobs.join(","));
+        let chunks = process_jobs_buffered(&spec_json, 2, None, None, None, None, None).unwrap();
+
+        let mut lines = 0;
+        while let Some(chunk) = chunks.next_chunk() {
+            let text = String::from_utf8(chunk).unwrap();
+            let count = text.lines().count();
+            assert!(
+                (1..=2).contains(&count),
+                "chunk size out of bounds: {count}"
+            );
+            for line in text.lines() {
+                let value: serde_json::Value = serde_json::from_str(line).unwrap();
+                assert!(value.get("id").is_some());
+            }
+            lines += count;
+        }
+        assert_eq!(lines, 5);
+    }
+
+    #[test]
+    fn force_format_overrides_every_job() {
+        let spec_json = r#"{
+            "version": "1.0",
+            "jobs": [{
+                "id": "forced",
+                "font": {"path": "testdata/fonts/Arial-Black.ttf", "size": 200, "variations": {}},
+                "text": {"content": "A"},
+                "rendering": {"format": "pgm", "encoding": "base64", "width": 64, "height": 64}
+            }]
+        }"#;
+        let chunks =
+            process_jobs_buffered(spec_json, 1, None, None, None, None, Some("metrics")).unwrap();
+        let chunk = chunks.next_chunk().expect("one result");
+        let value: serde_json::Value = serde_json::from_slice(&chunk).unwrap();
+        assert_eq!(value["status"], "success");
+        assert!(value.get("metrics").is_some());
+        assert!(value.get("rendering").is_none());
+    }
+
     #[test]
     fn process_jobs_accepts_config_overrides() {
         let spec_json = r#"{
@@ -219,7 +369,7 @@ mod tests {
                 "rendering": {"format": "pgm", "encoding": "base64", "width": 32, "height": 32}
             }]
         }"#;
-        let result = process_jobs(spec_json, Some(64), Some(0), Some(5), Some("/tmp"));
+        let result = process_jobs(spec_json, Some(64), Some(0), Some(5), Some("/tmp"), None);
         assert!(result.is_ok());
     }
 }
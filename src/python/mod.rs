@@ -15,7 +15,7 @@ pub mod types;
 
 #[pyfunction]
 fn is_available() -> bool {
-    streaming::StreamingSession::new(None, Some(1), 4).is_ok()
+    streaming::bindings_available()
 }
 
 /// Python module definition.
@@ -29,10 +29,12 @@ fn _haforu(m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     // Add batch mode function
     m.add_function(wrap_pyfunction!(batch::process_jobs, m)?)?;
+    m.add_function(wrap_pyfunction!(batch::process_jobs_buffered, m)?)?;
     m.add_function(wrap_pyfunction!(is_available, m)?)?;
 
     // Add streaming session class
     m.add_class::<streaming::StreamingSession>()?;
+    m.add_class::<streaming::CacheStats>()?;
 
     // Add image processing functions (v2.2)
     m.add_function(wrap_pyfunction!(image_ops::align_and_compare, m)?)?;
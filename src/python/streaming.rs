@@ -5,22 +5,135 @@
 //! This module provides the `StreamingSession` class for Python, which maintains
 //! a persistent font cache and allows zero-overhead rendering across multiple calls.
 
-use numpy::PyArray2;
-use pyo3::exceptions::{PyRuntimeError, PyValueError};
+use numpy::ndarray::Dimension;
+use numpy::{PyArray, PyArray1, PyArray2, PyArray3, PyArrayMethods, PyUntypedArrayMethods};
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::{PyKeyError, PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::{PyAny, PyType};
+use pyo3::types::{PyAny, PyBytes, PyDict, PyIterator, PyList, PyString, PyType};
+use rayon::prelude::*;
 use serde_json::Value;
 use std::collections::HashMap;
 use std::sync::atomic::{AtomicBool, Ordering};
-use std::sync::{Arc, Mutex};
+use std::sync::{Arc, Mutex, OnceLock};
+use std::time::Instant;
 
 use crate::batch::{Job, JobResult};
+use crate::bufpool::PooledBuffer;
 use crate::cache::GlyphCache;
 use crate::fonts::FontLoader;
 use crate::{
-    process_job_with_options, ExecutionOptions, GlyphRasterizer, ShapeRequest, TextShaper,
+    process_job_with_options, ExecutionOptions, GlyphRasterizer, Image, ShapeRequest, TextShaper,
 };
-use camino::Utf8PathBuf;
+use camino::{Utf8Path, Utf8PathBuf};
+
+/// Snapshot of a session's font and glyph cache counters.
+///
+/// Counters are plain attributes (`stats.glyph_hits`). The mapping protocol
+/// (`stats["glyph_hits"]`, `stats.get(...)`, `keys()`/`values()`/`items()`,
+/// iteration, `len()`, `dict(stats)`) still works for callers written
+/// against the old dict return value.
+#[pyclass(frozen)]
+#[derive(Clone, Copy, Debug, Default, PartialEq, Eq)]
+pub struct CacheStats {
+    /// Font cache capacity (same as `font_capacity`)
+    #[pyo3(get)]
+    pub capacity: usize,
+    /// Fonts currently cached (same as `font_entries`)
+    #[pyo3(get)]
+    pub entries: usize,
+    #[pyo3(get)]
+    pub font_capacity: usize,
+    #[pyo3(get)]
+    pub font_entries: usize,
+    /// Glyph cache capacity; 0 when the glyph cache is disabled
+    #[pyo3(get)]
+    pub glyph_capacity: usize,
+    #[pyo3(get)]
+    pub glyph_entries: usize,
+    #[pyo3(get)]
+    pub glyph_hits: u64,
+}
+
+impl CacheStats {
+    const KEYS: [&'static str; 7] = [
+        "capacity",
+        "entries",
+        "font_capacity",
+        "font_entries",
+        "glyph_capacity",
+        "glyph_entries",
+        "glyph_hits",
+    ];
+
+    fn field(&self, key: &str) -> Option<u64> {
+        let value = match key {
+            "capacity" => self.capacity,
+            "entries" => self.entries,
+            "font_capacity" => self.font_capacity,
+            "font_entries" => self.font_entries,
+            "glyph_capacity" => self.glyph_capacity,
+            "glyph_entries" => self.glyph_entries,
+            "glyph_hits" => return Some(self.glyph_hits),
+            _ => return None,
+        };
+        Some(value as u64)
+    }
+
+    fn pairs(&self) -> impl Iterator<Item = (&'static str, u64)> + '_ {
+        Self::KEYS
+            .into_iter()
+            .map(|key| (key, self.field(key).unwrap_or_default()))
+    }
+}
+
+#[pymethods]
+impl CacheStats {
+    fn __getitem__(&self, key: &str) -> PyResult<u64> {
+        self.field(key)
+            .ok_or_else(|| PyKeyError::new_err(key.to_string()))
+    }
+
+    #[pyo3(signature = (key, default=None))]
+    fn get(&self, py: Python<'_>, key: &str, default: Option<PyObject>) -> PyObject {
+        match self.field(key) {
+            Some(value) => value.into_py(py),
+            None => default.unwrap_or_else(|| py.None()),
+        }
+    }
+
+    fn keys(&self) -> Vec<&'static str> {
+        Self::KEYS.to_vec()
+    }
+
+    fn values(&self) -> Vec<u64> {
+        self.pairs().map(|(_, value)| value).collect()
+    }
+
+    fn items(&self) -> Vec<(&'static str, u64)> {
+        self.pairs().collect()
+    }
+
+    fn __iter__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyIterator>> {
+        PyList::new_bound(py, Self::KEYS).as_any().iter()
+    }
+
+    fn __len__(&self) -> usize {
+        Self::KEYS.len()
+    }
+
+    fn __contains__(&self, key: &str) -> bool {
+        self.field(key).is_some()
+    }
+
+    fn __repr__(&self) -> String {
+        let fields: Vec<String> = self
+            .pairs()
+            .map(|(key, value)| format!("{key}={value}"))
+            .collect();
+        format!("CacheStats({})", fields.join(", "))
+    }
+}
 
 /// Persistent rendering session with font cache.
 ///
@@ -44,7 +157,7 @@ use camino::Utf8PathBuf;
 ///     result = json.loads(result_json)
 ///     print(f"Status: {result['status']}")
 /// ```
-#[pyclass]
+#[pyclass(subclass)]
 pub struct StreamingSession {
     font_loader: Arc<Mutex<FontLoader>>,
     glyph_cache: Option<GlyphCache>,
@@ -66,7 +179,7 @@ impl StreamingSession {
 
     #[classmethod]
     fn is_available(_cls: &Bound<'_, PyType>) -> bool {
-        StreamingSession::build(1, 4).is_ok()
+        bindings_available()
     }
 
     fn ensure_open(&self) -> PyResult<()> {
@@ -85,28 +198,33 @@ impl StreamingSession {
     ///     size: Font size in points (default 600).
     ///     width: Canvas width (default 128).
     ///     height: Canvas height (default 128).
+    ///     ping: Also run the `ping()` liveness probe, saving a second call.
     ///
     /// Returns:
-    ///     bool: True when warm-up completed.
-    #[pyo3(signature = (font_path=None, *, text="Haforu", size=600.0, width=128, height=128))]
-    fn warm_up<'py>(
+    ///     bool: True when warm-up (and the probe, if requested) completed.
+    #[pyo3(signature = (
+        font_path=None, *, text="Haforu", size=600.0, width=128, height=128, ping=false
+    ))]
+    fn warm_up(
         &self,
-        py: Python<'py>,
         font_path: Option<&str>,
         text: &str,
         size: f64,
         width: u32,
         height: u32,
+        ping: bool,
     ) -> PyResult<bool> {
         self.ensure_open()?;
         if let Some(path) = font_path {
-            // Render via numpy path; ignore pixels but surface errors.
-            let _ =
-                self.render_to_numpy(py, path, text, size, width, height, None, None, None, None)?;
+            // Render once to populate the font cache; ignore pixels but surface errors.
+            self.render_image(path, text, size, width, height, None, None, None, None)?;
         } else {
             // Touch the cache to ensure structures are allocated.
             let _unused = self.font_loader.lock().unwrap();
         }
+        if ping {
+            return self.ping();
+        }
         Ok(true)
     }
 
@@ -117,7 +235,7 @@ impl StreamingSession {
     }
 
     /// Return cache statistics for observability.
-    fn cache_stats(&self) -> PyResult<HashMap<&'static str, usize>> {
+    fn cache_stats(&self) -> PyResult<CacheStats> {
         let loader = self.font_loader.lock().unwrap();
         let stats = loader.stats();
         let glyph_stats = self
@@ -125,15 +243,68 @@ impl StreamingSession {
             .as_ref()
             .map(|cache| cache.stats())
             .unwrap_or_default();
-        Ok(HashMap::from([
-            ("capacity", stats.capacity),
-            ("entries", stats.entries),
-            ("font_capacity", stats.capacity),
-            ("font_entries", stats.entries),
-            ("glyph_capacity", glyph_stats.capacity),
-            ("glyph_entries", glyph_stats.entries),
-            ("glyph_hits", glyph_stats.hits as usize),
-        ]))
+        Ok(CacheStats {
+            capacity: stats.capacity,
+            entries: stats.entries,
+            font_capacity: stats.capacity,
+            font_entries: stats.entries,
+            glyph_capacity: glyph_stats.capacity,
+            glyph_entries: glyph_stats.entries,
+            glyph_hits: glyph_stats.hits,
+        })
+    }
+
+    /// Return the font paths currently held in the font cache, sorted.
+    ///
+    /// Pass them to ``register_font()`` in a later session to pre-load the
+    /// same fonts before the first job arrives.
+    fn font_paths(&self) -> PyResult<Vec<String>> {
+        self.ensure_open()?;
+        Ok(self.font_loader.lock().unwrap().cached_paths())
+    }
+
+    /// Return the cached font instances as ``(path, variations)`` pairs, sorted by path.
+    ///
+    /// Pass each pair to ``register_font()`` in a later session to pre-load the
+    /// same instances, variable-font locations included, before the first job
+    /// arrives.
+    fn font_instances(&self) -> PyResult<Vec<(String, HashMap<String, f32>)>> {
+        self.ensure_open()?;
+        Ok(self.font_loader.lock().unwrap().cached_instances())
+    }
+
+    /// Load a font into the session cache without shaping or rendering.
+    ///
+    /// The file is memory-mapped and parsed once; later jobs naming the same
+    /// path (and variation coordinates) reuse the cached instance. Unlike
+    /// `warm_up(font_path)`, no warm-up text is rasterized.
+    ///
+    /// # Arguments
+    ///
+    /// * `font_path` - Path to the font file
+    /// * `variations` - Optional variation coordinates of the instance to load
+    ///
+    /// # Raises
+    ///
+    /// * `RuntimeError` - Font loading failed
+    #[pyo3(signature = (font_path, variations=None))]
+    fn register_font(
+        &self,
+        font_path: &str,
+        variations: Option<HashMap<String, f64>>,
+    ) -> PyResult<()> {
+        self.ensure_open()?;
+        let variations: HashMap<String, f32> = variations
+            .unwrap_or_default()
+            .into_iter()
+            .map(|(k, v)| (k, v as f32))
+            .collect();
+        self.font_loader
+            .lock()
+            .unwrap()
+            .load_font(Utf8Path::new(font_path), &variations)
+            .map_err(|e| PyRuntimeError::new_err(format!("Font loading failed: {}", e)))?;
+        Ok(())
     }
 
     /// Resize the cache capacity (drops stored entries).
@@ -190,21 +361,177 @@ impl StreamingSession {
     /// })
     /// result_json = session.render(job_json)
     /// ```
-    fn render(&self, job_json: &str) -> PyResult<String> {
+    fn render<'py>(&self, py: Python<'py>, job_json: &str) -> PyResult<Bound<'py, PyString>> {
         self.ensure_open()?;
-        let job = match parse_stream_job(job_json) {
-            Ok(job) => job,
-            Err(err_result) => return serialize_job_result(err_result),
+        let result = match parse_stream_job(job_json) {
+            Ok(job) => self.run_job(&job),
+            Err(err_result) => err_result,
         };
+        job_result_to_pystring(py, &result)
+    }
 
-        let result = {
-            let loader = self.font_loader.lock().unwrap();
-            let mut opts = ExecutionOptions::default();
-            opts.glyph_cache = self.glyph_cache.clone();
-            process_job_with_options(&job, &loader, &opts)
+    /// Render a single MessagePack-encoded job and return a MessagePack result.
+    ///
+    /// Same job and result shapes as `render()`, but both sides skip JSON
+    /// text: the result is a map with the same keys as the JSON result.
+    /// Undecodable input produces an error result rather than raising.
+    ///
+    /// # Example
+    ///
+    /// ```python
+    /// import msgpack
+    /// result = msgpack.unpackb(session.render_msgpack(msgpack.packb(job)))
+    /// ```
+    fn render_msgpack<'py>(
+        &self,
+        py: Python<'py>,
+        job_msgpack: &[u8],
+    ) -> PyResult<Bound<'py, PyBytes>> {
+        self.ensure_open()?;
+        let result = match rmp_serde::from_slice::<Job>(job_msgpack) {
+            Ok(job) => self.run_job(&job),
+            Err(err) => {
+                JobResult::error("stream-invalid", format!("Invalid MessagePack job: {err}"))
+            }
         };
+        let encoded = rmp_serde::to_vec_named(&result)
+            .map_err(|e| PyRuntimeError::new_err(format!("Failed to serialize result: {e}")))?;
+        Ok(PyBytes::new_bound(py, &encoded))
+    }
+
+    /// Render a single job and return its raw grayscale bitmap.
+    ///
+    /// Skips image encoding entirely: `rendering.format` and
+    /// `rendering.encoding` are ignored and the pixels come back as one
+    /// row-major 8-bit buffer, ready for `memoryview` or `numpy.frombuffer`.
+    ///
+    /// # Returns
+    ///
+    /// `(meta, pixels)` where `meta` holds `id`, `width`, `height`, `stride`
+    /// (bytes per row) and `total_ms`
+    ///
+    /// # Raises
+    ///
+    /// * `ValueError` - Invalid JSON or job specification
+    /// * `RuntimeError` - Font loading or rendering errors
+    fn render_raw<'py>(
+        &self,
+        py: Python<'py>,
+        job_json: &str,
+    ) -> PyResult<(Bound<'py, PyDict>, Bound<'py, PyBytes>)> {
+        self.ensure_open()?;
+        let job = parse_raw_job(job_json)?;
+        let (image, total_ms) = self.rasterize_job(&job)?;
+        let meta = raw_meta(py, &job, total_ms)?;
+        Ok((meta, PyBytes::new_bound(py, image.pixels())))
+    }
 
-        serialize_job_result(result)
+    /// Render a single job straight into a caller-owned buffer.
+    ///
+    /// Like `render_raw()`, but the grayscale bitmap is copied into `out`
+    /// (a `bytearray`, writeable `memoryview`, uint8 numpy array or any
+    /// other writeable C-contiguous byte buffer) instead of a new `bytes`
+    /// object, so a render loop can reuse one allocation. Only the first
+    /// `width * height` bytes of `out` are written.
+    ///
+    /// # Returns
+    ///
+    /// The same `meta` dict as `render_raw()`
+    ///
+    /// # Raises
+    ///
+    /// * `ValueError` - Invalid job, or `out` is read-only, non-contiguous or too small
+    /// * `RuntimeError` - Font loading or rendering errors
+    ///
+    /// # Example
+    ///
+    /// ```python
+    /// buf = bytearray(width * height)
+    /// for job_json in jobs:
+    ///     meta = session.render_into(job_json, buf)
+    /// ```
+    fn render_into<'py>(
+        &self,
+        py: Python<'py>,
+        job_json: &str,
+        out: &Bound<'py, PyAny>,
+    ) -> PyResult<Bound<'py, PyDict>> {
+        self.ensure_open()?;
+        let job = parse_raw_job(job_json)?;
+        let buffer = PyBuffer::<u8>::get_bound(out)?;
+        let required = job.rendering.width as usize * job.rendering.height as usize;
+        if buffer.readonly() || !buffer.is_c_contiguous() {
+            return Err(PyValueError::new_err(
+                "out buffer must be writeable and C-contiguous",
+            ));
+        }
+        if buffer.item_count() < required {
+            return Err(PyValueError::new_err(format!(
+                "out buffer holds {} bytes, the render needs {}",
+                buffer.item_count(),
+                required
+            )));
+        }
+
+        let (image, total_ms) = self.rasterize_job(&job)?;
+        // Checked above, so this only fails if the buffer changed under us
+        let cells = buffer.as_mut_slice(py).ok_or_else(|| {
+            PyValueError::new_err("out buffer must be writeable and C-contiguous")
+        })?;
+        for (cell, &pixel) in cells.iter().zip(image.pixels()) {
+            cell.set(pixel);
+        }
+        raw_meta(py, &job, total_ms)
+    }
+
+    /// Render several jobs in parallel and return their results in input order.
+    ///
+    /// Jobs share the session's font and glyph caches and are spread across
+    /// the rayon thread pool; the GIL is released for the whole batch.
+    /// Malformed entries produce error results rather than raising, exactly
+    /// like `render()`. A batch of one job is rendered inline on the calling
+    /// thread, skipping the thread-pool hand-off.
+    ///
+    /// # Arguments
+    ///
+    /// * `jobs_json` - List of JSON strings, each containing one Job
+    ///
+    /// # Returns
+    ///
+    /// List of JSONL result strings, one per input job
+    fn render_batch(&self, py: Python<'_>, jobs_json: Vec<String>) -> PyResult<Vec<String>> {
+        self.ensure_open()?;
+        if jobs_json.len() <= 1 {
+            // Waking a pool worker and blocking on it costs more than the
+            // parallelism can win back for a single job.
+            return jobs_json
+                .iter()
+                .map(|job_json| {
+                    let result = match parse_stream_job(job_json) {
+                        Ok(job) => self.run_job(&job),
+                        Err(err_result) => err_result,
+                    };
+                    serialize_job_result(result)
+                })
+                .collect();
+        }
+        let font_loader = &self.font_loader;
+        let mut opts = ExecutionOptions::default();
+        opts.glyph_cache = self.glyph_cache.clone();
+
+        py.allow_threads(|| {
+            let loader = font_loader.lock().unwrap();
+            jobs_json
+                .par_iter()
+                .map(|job_json| {
+                    let result = match parse_stream_job(job_json) {
+                        Ok(job) => process_job_with_options(&job, &loader, &opts),
+                        Err(err_result) => err_result,
+                    };
+                    serialize_job_result(result)
+                })
+                .collect()
+        })
     }
 
     /// Render text directly to numpy array (zero-copy).
@@ -220,6 +547,8 @@ impl StreamingSession {
     /// * `script` - Script tag (default: "Latn")
     /// * `direction` - Text direction (default: "ltr")
     /// * `language` - Language tag (default: "en")
+    /// * `out` - Optional C-contiguous, writeable uint8 array of shape
+    ///   (height, width) to render into; it is returned instead of a new array
     ///
     /// # Returns
     ///
@@ -228,7 +557,7 @@ impl StreamingSession {
     ///
     /// # Raises
     ///
-    /// * `ValueError` - Invalid parameters
+    /// * `ValueError` - Invalid parameters (including a mismatched `out` array)
     /// * `RuntimeError` - Font loading or rendering errors
     ///
     /// # Example
@@ -245,8 +574,12 @@ impl StreamingSession {
     /// )
     /// assert image.shape == (1200, 3000)
     /// assert image.dtype == numpy.uint8
+    ///
+    /// # Reuse one buffer across renders
+    /// buf = numpy.empty((1200, 3000), dtype=numpy.uint8)
+    /// session.render_to_numpy("/path/to/font.ttf", "b", 1000.0, 3000, 1200, out=buf)
     /// ```
-    #[pyo3(signature = (font_path, text, size, width, height, variations=None, script=None, direction=None, language=None))]
+    #[pyo3(signature = (font_path, text, size, width, height, variations=None, script=None, direction=None, language=None, out=None))]
     fn render_to_numpy<'py>(
         &self,
         py: Python<'py>,
@@ -259,69 +592,114 @@ impl StreamingSession {
         script: Option<&str>,
         direction: Option<&str>,
         language: Option<&str>,
+        out: Option<Bound<'py, PyArray2<u8>>>,
     ) -> PyResult<Bound<'py, PyArray2<u8>>> {
         self.ensure_open()?;
-        // Convert font path to Utf8PathBuf
-        let font_path_buf = Utf8PathBuf::from(font_path);
+        if let Some(array) = out.as_ref() {
+            check_out_array(array, &[height as usize, width as usize])?;
+        }
 
-        // Convert variation coordinates from f64 to f32
-        let variations_f32: HashMap<String, f32> = variations
-            .unwrap_or_default()
-            .into_iter()
-            .map(|(k, v)| (k, v as f32))
-            .collect();
+        let image = self.render_image(
+            font_path, text, size, width, height, variations, script, direction, language,
+        )?;
 
-        // Load font with variations
-        let font_instance = {
-            let loader = self.font_loader.lock().unwrap();
-            loader
-                .load_font(&font_path_buf, &variations_f32)
-                .map_err(|e| PyRuntimeError::new_err(format!("Font loading failed: {}", e)))?
-        };
+        match out {
+            Some(array) => {
+                fill_out_array(&array, |slice| {
+                    slice.copy_from_slice(image.pixels());
+                    Ok(())
+                })?;
+                Ok(array)
+            }
+            // Hand the pixel buffer to numpy as-is; shape (height, width) in row-major order.
+            None => PyArray1::from_vec_bound(py, image.into_pixels())
+                .reshape([height as usize, width as usize])
+                .map_err(|e| {
+                    PyRuntimeError::new_err(format!("Failed to create numpy array: {}", e))
+                }),
+        }
+    }
 
-        // Shape text
-        let shaper = TextShaper::new();
-        let tmp_features: [String; 0] = [];
-        let request = ShapeRequest {
-            text,
-            script,
-            direction,
-            language,
-            features: &tmp_features,
+    /// Render several texts with shared settings into one (M, H, W) numpy array.
+    ///
+    /// All renders land in a single contiguous uint8 tensor, so callers can run
+    /// vectorized NumPy reductions over every glyph at once instead of looping
+    /// over per-glyph arrays.
+    ///
+    /// # Arguments
+    ///
+    /// * `font_path` - Absolute path to font file
+    /// * `texts` - Texts to render, one frame each (typically single glyphs)
+    /// * `size`, `width`, `height`, `variations`, `script`, `direction`, `language` -
+    ///   Same meaning as in `render_to_numpy`, applied to every text
+    /// * `out` - Optional C-contiguous, writeable uint8 array of shape
+    ///   (len(texts), height, width) to render into
+    ///
+    /// # Returns
+    ///
+    /// 3D numpy array of shape (len(texts), height, width), dtype uint8
+    ///
+    /// # Raises
+    ///
+    /// * `ValueError` - Invalid parameters (including a mismatched `out` array)
+    /// * `RuntimeError` - Font loading or rendering errors
+    ///
+    /// # Example
+    ///
+    /// ```python
+    /// images = session.render_to_numpy_batch("/path/to/font.ttf", ["a", "b", "c"], 1000.0, 3000, 1200)
+    /// assert images.shape == (3, 1200, 3000)
+    /// coverage = (images != 0).sum(axis=(1, 2)) / (1200 * 3000)
+    /// ```
+    #[pyo3(signature = (font_path, texts, size, width, height, variations=None, script=None, direction=None, language=None, out=None))]
+    fn render_to_numpy_batch<'py>(
+        &self,
+        py: Python<'py>,
+        font_path: &str,
+        texts: Vec<String>,
+        size: f64,
+        width: u32,
+        height: u32,
+        variations: Option<HashMap<String, f64>>,
+        script: Option<&str>,
+        direction: Option<&str>,
+        language: Option<&str>,
+        out: Option<Bound<'py, PyArray3<u8>>>,
+    ) -> PyResult<Bound<'py, PyArray3<u8>>> {
+        self.ensure_open()?;
+        if width == 0 || height == 0 {
+            return Err(PyValueError::new_err(
+                "Canvas width and height must be non-zero",
+            ));
+        }
+        let shape = [texts.len(), height as usize, width as usize];
+        let array = match out {
+            Some(array) => {
+                check_out_array(&array, &shape)?;
+                array
+            }
+            None => PyArray3::<u8>::zeros_bound(py, shape, false),
         };
-        let shaped = shaper
-            .shape_with_request(
-                &font_instance,
-                &request,
-                size as f32,
-                font_path_buf.as_std_path(),
-            )
-            .map_err(|e| PyRuntimeError::new_err(format!("Text shaping failed: {}", e)))?;
 
-        // Rasterize
-        let rasterizer = GlyphRasterizer::new();
-        let image = rasterizer
-            .render_text(
-                &font_instance,
-                &shaped,
-                width,
-                height,
-                0.0, // No tracking
-                font_path_buf.as_std_path(),
-            )
-            .map_err(|e| PyRuntimeError::new_err(format!("Rendering failed: {}", e)))?;
-
-        // Convert to 2D array: pixels is Vec<u8> of length width*height
-        // numpy expects shape (height, width) in row-major order
-        let array_2d: Vec<Vec<u8>> = image
-            .pixels()
-            .chunks(image.width() as usize)
-            .map(|row| row.to_vec())
-            .collect();
-
-        // Convert to numpy array using from_vec2_bound (returns Bound)
-        PyArray2::from_vec2_bound(py, &array_2d)
-            .map_err(|e| PyRuntimeError::new_err(format!("Failed to create numpy array: {}", e)))
+        fill_out_array(&array, |slice| {
+            let frame_len = shape[1] * shape[2];
+            for (text, frame) in texts.iter().zip(slice.chunks_exact_mut(frame_len)) {
+                let image = self.render_image(
+                    font_path,
+                    text,
+                    size,
+                    width,
+                    height,
+                    variations.clone(),
+                    script,
+                    direction,
+                    language,
+                )?;
+                frame.copy_from_slice(image.pixels());
+            }
+            Ok(())
+        })?;
+        Ok(array)
     }
 
     /// Close session and release resources immediately.
@@ -360,6 +738,106 @@ impl Drop for StreamingSession {
 }
 
 impl StreamingSession {
+    /// Run a parsed job against the session font and glyph caches.
+    fn run_job(&self, job: &Job) -> JobResult {
+        let loader = self.font_loader.lock().unwrap();
+        let mut opts = ExecutionOptions::default();
+        opts.glyph_cache = self.glyph_cache.clone();
+        process_job_with_options(job, &loader, &opts)
+    }
+
+    /// Shape and rasterize `text` with the session font cache.
+    #[allow(clippy::too_many_arguments)]
+    fn render_image(
+        &self,
+        font_path: &str,
+        text: &str,
+        size: f64,
+        width: u32,
+        height: u32,
+        variations: Option<HashMap<String, f64>>,
+        script: Option<&str>,
+        direction: Option<&str>,
+        language: Option<&str>,
+    ) -> PyResult<Image> {
+        // Convert variation coordinates from f64 to f32
+        let variations_f32: HashMap<String, f32> = variations
+            .unwrap_or_default()
+            .into_iter()
+            .map(|(k, v)| (k, v as f32))
+            .collect();
+
+        let tmp_features: [String; 0] = [];
+        let request = ShapeRequest {
+            text,
+            script,
+            direction,
+            language,
+            features: &tmp_features,
+        };
+        self.rasterize(
+            &Utf8PathBuf::from(font_path),
+            &variations_f32,
+            &request,
+            size as f32,
+            width,
+            height,
+        )
+    }
+
+    /// Rasterize `job` to a bare bitmap, returning it with the elapsed
+    /// time in milliseconds.
+    fn rasterize_job(&self, job: &Job) -> PyResult<(Image, f64)> {
+        let start = Instant::now();
+        let image = self.rasterize(
+            &job.font.path,
+            &job.font.variations,
+            &ShapeRequest::from(&job.text),
+            job.font.size as f32,
+            job.rendering.width,
+            job.rendering.height,
+        )?;
+        Ok((image, start.elapsed().as_secs_f64() * 1000.0))
+    }
+
+    /// Load, shape and rasterize one shaping request with the session font cache.
+    fn rasterize(
+        &self,
+        font_path: &Utf8Path,
+        variations: &HashMap<String, f32>,
+        request: &ShapeRequest<'_>,
+        size: f32,
+        width: u32,
+        height: u32,
+    ) -> PyResult<Image> {
+        // Load font with variations
+        let font_instance = {
+            let loader = self.font_loader.lock().unwrap();
+            loader
+                .load_font(font_path, variations)
+                .map_err(|e| PyRuntimeError::new_err(format!("Font loading failed: {}", e)))?
+        };
+
+        // Shape text
+        let shaper = TextShaper::new();
+        let shaped = shaper
+            .shape_with_request(&font_instance, request, size, font_path.as_std_path())
+            .map_err(|e| PyRuntimeError::new_err(format!("Text shaping failed: {}", e)))?;
+
+        // Rasterize
+        let rasterizer = GlyphRasterizer::new();
+        rasterizer
+            .render_text(
+                &font_instance,
+                &shaped,
+                width,
+                height,
+                0.0, // No tracking
+                font_path.as_std_path(),
+            )
+            .map_err(|e| PyRuntimeError::new_err(format!("Rendering failed: {}", e)))
+    }
+
     fn build(max_fonts: usize, max_glyphs: usize) -> PyResult<Self> {
         if max_fonts == 0 {
             return Err(PyValueError::new_err(
@@ -375,30 +853,113 @@ impl StreamingSession {
     }
 }
 
+/// Whether a session can be built, probed once per process.
+///
+/// Availability cannot change after the extension is loaded, so repeat
+/// `is_available()` calls only read the cached answer.
+pub(crate) fn bindings_available() -> bool {
+    static AVAILABLE: OnceLock<bool> = OnceLock::new();
+    *AVAILABLE.get_or_init(|| StreamingSession::build(1, 4).is_ok())
+}
+
+/// Reject `out` arrays that cannot hold a render of `expected` shape in place.
+fn check_out_array<D: Dimension>(
+    array: &Bound<'_, PyArray<u8, D>>,
+    expected: &[usize],
+) -> PyResult<()> {
+    if array.shape() != expected {
+        return Err(PyValueError::new_err(format!(
+            "out array has shape {:?}, expected {:?}",
+            array.shape(),
+            expected
+        )));
+    }
+    if !array.is_c_contiguous() {
+        return Err(PyValueError::new_err("out array must be C-contiguous"));
+    }
+    Ok(())
+}
+
+/// Borrow `array` as one flat writeable slice and hand it to `fill`.
+fn fill_out_array<D: Dimension>(
+    array: &Bound<'_, PyArray<u8, D>>,
+    fill: impl FnOnce(&mut [u8]) -> PyResult<()>,
+) -> PyResult<()> {
+    let mut view = array
+        .try_readwrite()
+        .map_err(|e| PyValueError::new_err(format!("out array is not writeable: {}", e)))?;
+    let slice = view
+        .as_slice_mut()
+        .map_err(|e| PyValueError::new_err(format!("out array must be C-contiguous: {}", e)))?;
+    fill(slice)
+}
+
+/// Parse a job for the raw-pixel entry points, raising instead of returning
+/// an error result.
+fn parse_raw_job(job_json: &str) -> PyResult<Job> {
+    parse_stream_job(job_json).map_err(|err| {
+        PyValueError::new_err(err.error.unwrap_or_else(|| "Invalid job".to_string()))
+    })
+}
+
+/// Metadata returned alongside raw pixels by `render_raw()`/`render_into()`.
+fn raw_meta<'py>(py: Python<'py>, job: &Job, total_ms: f64) -> PyResult<Bound<'py, PyDict>> {
+    let meta = PyDict::new_bound(py);
+    meta.set_item("id", &job.id)?;
+    meta.set_item("width", job.rendering.width)?;
+    meta.set_item("height", job.rendering.height)?;
+    meta.set_item("stride", job.rendering.width)?;
+    meta.set_item("total_ms", total_ms)?;
+    Ok(meta)
+}
+
 fn parse_stream_job(job_json: &str) -> Result<Job, JobResult> {
     let trimmed = job_json.trim();
     if trimmed.is_empty() {
         return Err(JobResult::error("stream-empty", "Job payload is empty"));
     }
 
+    // Well-formed jobs deserialize straight into `Job` without building a
+    // `Value` tree; only failures are re-parsed through `Value`, which tells
+    // malformed JSON apart from a bad job and recovers the job id.
+    let job: Job = match serde_json::from_str(trimmed) {
+        Ok(job) => job,
+        Err(_) => classify_stream_job_error(trimmed)?,
+    };
+
+    if let Err(err) = job.validate() {
+        return Err(JobResult::error(job.id.clone(), err.to_string()));
+    }
+
+    Ok(job)
+}
+
+/// Re-parse a payload that failed to deserialize directly as a `Job`.
+///
+/// Usually this builds the error result. Going through `Value` is more
+/// lenient than the direct path, though: duplicate keys are accepted (last
+/// value wins) where `from_str::<Job>` rejects them, so such jobs are
+/// returned for rendering as before.
+fn classify_stream_job_error(trimmed: &str) -> Result<Job, JobResult> {
     let fallback_id = "stream-invalid".to_string();
-    let parsed_value: Value = serde_json::from_str(trimmed)
-        .map_err(|err| JobResult::error(fallback_id.clone(), format!("Invalid JSON: {err}")))?;
+    let parsed_value: Value = match serde_json::from_str(trimmed) {
+        Ok(value) => value,
+        Err(err) => {
+            return Err(JobResult::error(
+                fallback_id,
+                format!("Invalid JSON: {err}"),
+            ))
+        }
+    };
 
     let job_id = parsed_value
         .get("id")
         .and_then(|value| value.as_str())
         .map(|s| s.to_string())
-        .unwrap_or_else(|| fallback_id.clone());
+        .unwrap_or(fallback_id);
 
-    let job: Job = serde_json::from_value(parsed_value)
-        .map_err(|err| JobResult::error(job_id.clone(), format!("Invalid job JSON: {err}")))?;
-
-    if let Err(err) = job.validate() {
-        return Err(JobResult::error(job.id.clone(), err.to_string()));
-    }
-
-    Ok(job)
+    serde_json::from_value::<Job>(parsed_value)
+        .map_err(|err| JobResult::error(job_id, format!("Invalid job JSON: {err}")))
 }
 
 fn serialize_job_result(result: JobResult) -> PyResult<String> {
@@ -406,11 +967,28 @@ fn serialize_job_result(result: JobResult) -> PyResult<String> {
         .map_err(|e| PyValueError::new_err(format!("Failed to serialize result: {}", e)))
 }
 
+/// Serialize `result` straight into a Python `str`.
+///
+/// The JSON is written into a buffer from the thread-local pool rather than
+/// a fresh `String`, so back-to-back renders reuse one allocation before the
+/// text is copied into Python.
+fn job_result_to_pystring<'py>(
+    py: Python<'py>,
+    result: &JobResult,
+) -> PyResult<Bound<'py, PyString>> {
+    let mut buf = PooledBuffer::new(0);
+    serde_json::to_writer(&mut *buf, result)
+        .map_err(|e| PyValueError::new_err(format!("Failed to serialize result: {}", e)))?;
+    let json = std::str::from_utf8(&buf)
+        .map_err(|e| PyValueError::new_err(format!("Failed to serialize result: {}", e)))?;
+    Ok(PyString::new_bound(py, json))
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
+    use pyo3::types::PyByteArray;
     use serde_json::json;
-    use std::time::Instant;
 
     #[test]
     fn test_streaming_session_creation() {
@@ -421,13 +999,55 @@ mod tests {
         });
     }
 
+    #[test]
+    fn register_font_loads_without_rendering() {
+        let session = StreamingSession::build(4, 8).unwrap();
+        session
+            .register_font("testdata/fonts/Arial-Black.ttf", None)
+            .unwrap();
+        session
+            .register_font("testdata/fonts/Arial-Black.ttf", None)
+            .unwrap();
+        assert_eq!(session.cache_stats().unwrap().font_entries, 1);
+        assert_eq!(session.cache_stats().unwrap().glyph_entries, 0);
+        assert_eq!(
+            session.font_instances().unwrap(),
+            vec![("testdata/fonts/Arial-Black.ttf".to_string(), HashMap::new())]
+        );
+        assert!(session
+            .register_font("/nonexistent/font.ttf", None)
+            .is_err());
+    }
+
+    #[test]
+    fn bindings_available_is_stable() {
+        assert!(bindings_available());
+        assert!(bindings_available());
+    }
+
+    #[test]
+    fn cache_stats_reads_as_attributes_or_items() {
+        let session = StreamingSession::build(4, 0).unwrap();
+        let stats = session.cache_stats().unwrap();
+        assert_eq!((stats.capacity, stats.font_capacity), (4, 4));
+        assert_eq!(stats.glyph_capacity, 0);
+        assert_eq!(stats.__getitem__("capacity").unwrap(), 4);
+        assert!(stats.__getitem__("missing").is_err());
+        assert!(stats.__contains__("glyph_hits"));
+        assert_eq!(stats.__len__(), stats.keys().len());
+        assert_eq!(stats.items()[0], ("capacity", 4));
+        assert_eq!(stats.values().len(), stats.keys().len());
+        assert!(stats.__repr__().starts_with("CacheStats(capacity=4, "));
+    }
+
     #[test]
     fn test_invalid_json() {
         pyo3::prepare_freethreaded_python();
-        Python::with_gil(|_py| {
+        Python::with_gil(|py| {
             let session = StreamingSession::build(512, 8).unwrap();
-            let result = session.render("not valid json").unwrap();
-            let payload: serde_json::Value = serde_json::from_str(&result).unwrap();
+            let result = session.render(py, "not valid json").unwrap();
+            let payload: serde_json::Value =
+                serde_json::from_str(result.to_str().unwrap()).unwrap();
             assert_eq!(
                 payload.get("status").and_then(|v| v.as_str()),
                 Some("error")
@@ -435,10 +1055,182 @@ mod tests {
         });
     }
 
+    #[test]
+    fn render_msgpack_round_trips_results() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let session = StreamingSession::build(4, 8).unwrap();
+            let job = json!({
+                "id": "msgpack",
+                "font": {"path": "testdata/fonts/Arial-Black.ttf", "size": 256, "variations": {}},
+                "text": {"content": "A"},
+                "rendering": {"format": "metrics", "encoding": "json", "width": 64, "height": 64}
+            });
+            let request = rmp_serde::to_vec_named(&job).unwrap();
+            let reply = session.render_msgpack(py, &request).unwrap();
+            let result: Value = rmp_serde::from_slice(reply.as_bytes()).unwrap();
+            assert_eq!(result["id"], "msgpack");
+            assert_eq!(result["status"], "success");
+            assert!(result["metrics"]["density"].as_f64().unwrap() > 0.0);
+
+            let reply = session.render_msgpack(py, b"\xc1").unwrap();
+            let result: Value = rmp_serde::from_slice(reply.as_bytes()).unwrap();
+            assert_eq!(result["status"], "error");
+        });
+    }
+
+    #[test]
+    fn render_raw_returns_unencoded_pixels() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let session = StreamingSession::build(4, 8).unwrap();
+            let job = json!({
+                "id": "raw",
+                "font": {"path": "testdata/fonts/Arial-Black.ttf", "size": 256, "variations": {}},
+                "text": {"content": "A"},
+                "rendering": {"format": "pgm", "encoding": "raw", "width": 64, "height": 48}
+            });
+            let (meta, pixels) = session.render_raw(py, &job.to_string()).unwrap();
+            let width: u32 = meta.get_item("width").unwrap().unwrap().extract().unwrap();
+            let stride: u32 = meta.get_item("stride").unwrap().unwrap().extract().unwrap();
+            assert_eq!((width, stride), (64, 64));
+            assert_eq!(pixels.as_bytes().len(), 64 * 48);
+            assert!(pixels.as_bytes().iter().any(|&p| p > 0));
+
+            let expected = session
+                .render_image(
+                    "testdata/fonts/Arial-Black.ttf",
+                    "A",
+                    256.0,
+                    64,
+                    48,
+                    None,
+                    None,
+                    None,
+                    None,
+                )
+                .unwrap();
+            assert_eq!(pixels.as_bytes(), expected.pixels());
+
+            assert!(session.render_raw(py, "not json").is_err());
+        });
+    }
+
+    #[test]
+    fn render_into_fills_caller_buffer() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let session = StreamingSession::build(4, 8).unwrap();
+            let job = json!({
+                "id": "into",
+                "font": {"path": "testdata/fonts/Arial-Black.ttf", "size": 256, "variations": {}},
+                "text": {"content": "A"},
+                "rendering": {"format": "pgm", "encoding": "raw", "width": 64, "height": 48}
+            })
+            .to_string();
+            let (_, expected) = session.render_raw(py, &job).unwrap();
+
+            // Larger than needed: only the leading width * height bytes change
+            let out = PyByteArray::new_bound(py, &[7u8; 64 * 48 + 16]);
+            let meta = session.render_into(py, &job, out.as_any()).unwrap();
+            let id: String = meta.get_item("id").unwrap().unwrap().extract().unwrap();
+            assert_eq!(id, "into");
+            let written = out.to_vec();
+            assert_eq!(&written[..64 * 48], expected.as_bytes());
+            assert!(written[64 * 48..].iter().all(|&b| b == 7));
+
+            let small = PyByteArray::new_bound(py, &[0u8; 16]);
+            assert!(session.render_into(py, &job, small.as_any()).is_err());
+            let readonly = PyBytes::new_bound(py, &[0u8; 64 * 48]);
+            assert!(session.render_into(py, &job, readonly.as_any()).is_err());
+        });
+    }
+
+    #[test]
+    fn invalid_job_errors_keep_their_id() {
+        let err = parse_stream_job(r#"{"id":"bad","font":{}}"#).unwrap_err();
+        assert_eq!(err.id, "bad");
+        assert!(err.error.unwrap().starts_with("Invalid job JSON"));
+
+        let err = parse_stream_job("{oops").unwrap_err();
+        assert_eq!(err.id, "stream-invalid");
+        assert!(err.error.unwrap().starts_with("Invalid JSON"));
+    }
+
+    #[test]
+    fn duplicate_keys_keep_the_last_value() {
+        let job = json!({
+            "id": "dup",
+            "font": {"path": "testdata/fonts/Arial-Black.ttf", "size": 256, "variations": {}},
+            "text": {"content": "A"},
+            "rendering": {"format": "metrics", "encoding": "json", "width": 64, "height": 64}
+        })
+        .to_string();
+        let duplicated = job.replacen(r#""id":"dup""#, r#""id":"first","id":"dup""#, 1);
+        assert!(serde_json::from_str::<Job>(&duplicated).is_err());
+
+        let parsed = parse_stream_job(&duplicated).expect("duplicate keys stay renderable");
+        assert_eq!(parsed.id, "dup");
+
+        // The fallback still validates what it recovers
+        let invalid = duplicated.replacen(r#""width":64"#, r#""width":64,"width":0"#, 1);
+        let err = parse_stream_job(&invalid).unwrap_err();
+        assert_eq!(err.id, "dup");
+        assert!(err.error.unwrap().contains("Canvas dimensions"));
+    }
+
+    #[test]
+    fn render_batch_preserves_input_order() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let session = StreamingSession::build(16, 64).unwrap();
+            let jobs: Vec<String> = ["A", "B", "C", "D"]
+                .iter()
+                .map(|glyph| {
+                    json!({
+                        "id": format!("batch-{glyph}"),
+                        "font": {
+                            "path": "testdata/fonts/Arial-Black.ttf",
+                            "size": 256,
+                            "variations": {}
+                        },
+                        "text": {"content": glyph},
+                        "rendering": {
+                            "format": "metrics",
+                            "encoding": "json",
+                            "width": 64,
+                            "height": 64
+                        }
+                    })
+                    .to_string()
+                })
+                .chain(std::iter::once("not valid json".to_string()))
+                .collect();
+
+            let results = session.render_batch(py, jobs.clone()).unwrap();
+            assert_eq!(results.len(), 5);
+            for (result, glyph) in results.iter().zip(["A", "B", "C", "D"]) {
+                let parsed: serde_json::Value = serde_json::from_str(result).unwrap();
+                assert_eq!(parsed["id"], format!("batch-{glyph}"));
+                assert_eq!(parsed["status"], "success");
+            }
+            let invalid: serde_json::Value = serde_json::from_str(&results[4]).unwrap();
+            assert_eq!(invalid["status"], "error");
+
+            // Single-job batches take the inline path and match the parallel one
+            let single = session.render_batch(py, jobs[..1].to_vec()).unwrap();
+            assert_eq!(single.len(), 1);
+            let single: serde_json::Value = serde_json::from_str(&single[0]).unwrap();
+            assert_eq!(single["id"], "batch-A");
+            assert_eq!(single["status"], "success");
+            assert!(session.render_batch(py, Vec::new()).unwrap().is_empty());
+        });
+    }
+
     #[test]
     fn cached_metrics_renders_stay_under_one_millisecond() {
         pyo3::prepare_freethreaded_python();
-        Python::with_gil(|_py| {
+        Python::with_gil(|py| {
             let session = StreamingSession::build(128, 256).unwrap();
             let mut job = json!({
                 "id": "perf-0",
@@ -461,8 +1253,9 @@ mod tests {
             for idx in 0..iterations {
                 job["id"] = format!("perf-{idx}").into();
                 let job_json = serde_json::to_string(&job).unwrap();
-                let payload = session.render(&job_json).unwrap();
-                let parsed: serde_json::Value = serde_json::from_str(&payload).unwrap();
+                let payload = session.render(py, &job_json).unwrap();
+                let parsed: serde_json::Value =
+                    serde_json::from_str(payload.to_str().unwrap()).unwrap();
                 assert_eq!(
                     parsed.get("status").and_then(|v| v.as_str()),
                     Some("success")
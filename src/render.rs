@@ -119,6 +119,48 @@ impl Image {
         (min_x, min_y, max_x - min_x + 1, max_y - min_y + 1)
     }
 
+    /// Compute density, count non-zero pixels and find their tight bounding box in one pass.
+    ///
+    /// Blank rows are skipped with the same SIMD check as `calculate_bbox`; they add
+    /// nothing to the density sum, so the result matches `density()` exactly.
+    pub fn density_coverage_and_bbox(&self) -> (f64, usize, (u32, u32, u32, u32)) {
+        let mut sum = 0u64;
+        let mut inked = 0usize;
+        let mut min_x = self.width;
+        let mut min_y = self.height;
+        let mut max_x = 0u32;
+        let mut max_y = 0u32;
+
+        for (y, row) in self.pixels.chunks_exact(self.width as usize).enumerate() {
+            if !Self::has_nonzero_simd(row) {
+                continue;
+            }
+            let y = y as u32;
+            min_y = min_y.min(y);
+            max_y = y;
+
+            for (x, &px) in row.iter().enumerate() {
+                if px > 0 {
+                    sum += px as u64;
+                    inked += 1;
+                    min_x = min_x.min(x as u32);
+                    max_x = max_x.max(x as u32);
+                }
+            }
+        }
+
+        if inked == 0 {
+            return (0.0, 0, (0, 0, 0, 0));
+        }
+
+        let density = (sum as f64 / (self.len() as u64 * 255) as f64).clamp(0.0, 1.0);
+        (
+            density,
+            inked,
+            (min_x, min_y, max_x - min_x + 1, max_y - min_y + 1),
+        )
+    }
+
     /// Check if slice has any non-zero bytes (SIMD-accelerated on x86_64).
     #[inline]
     fn has_nonzero_simd(slice: &[u8]) -> bool {
@@ -610,6 +652,30 @@ mod tests {
         );
     }
 
+    #[test]
+    fn density_coverage_and_bbox_matches_separate_passes() {
+        let mut pixels = vec![0u8; 100 * 50];
+        assert_eq!(
+            Image::new(100, 50, pixels.clone())
+                .unwrap()
+                .density_coverage_and_bbox(),
+            (0.0, 0, (0, 0, 0, 0))
+        );
+
+        for y in 10..15 {
+            for x in 20..30 {
+                pixels[y * 100 + x] = 128;
+            }
+        }
+        pixels[40 * 100 + 5] = 1;
+        let img = Image::new(100, 50, pixels).unwrap();
+        let (density, inked, bbox) = img.density_coverage_and_bbox();
+        assert_eq!(density, img.density());
+        assert_eq!(inked, 51);
+        assert_eq!(bbox, img.calculate_bbox());
+        assert_eq!(bbox, (5, 10, 25, 31));
+    }
+
     #[test]
     fn pixel_delta_clamps_on_invalid_inputs() {
         let img = Image::new(4, 4, vec![0u8; 16]).unwrap();
@@ -23,7 +23,8 @@ pub struct SweepPoint {
     pub coords: VariationCoords,
     /// Calculated metrics (density, beam)
     pub metrics: MetricsOutput,
-    /// Render time in milliseconds
+    /// Render time in milliseconds; 0.0 for a repeated coordinate set that
+    /// reused an earlier point's render
     pub render_ms: f64,
 }
 
@@ -57,7 +58,9 @@ pub struct SweepConfig {
 /// # Returns
 ///
 /// Vector of sweep points with metrics for each coordinate set, in the same
-/// order as `config.coord_sets`.
+/// order as `config.coord_sets`. Duplicate coordinate sets are rendered once
+/// and share the resulting metrics; only the first occurrence reports a
+/// render time, later ones report `render_ms` of 0.0.
 ///
 /// # Errors
 ///
@@ -103,14 +106,18 @@ pub fn render_variation_sweep(
     font_loader: &FontLoader,
     options: &ExecutionOptions,
 ) -> Result<Vec<SweepPoint>> {
-    // Process all coordinate sets in parallel using Rayon
-    let results: Result<Vec<SweepPoint>> = config
-        .coord_sets
+    // Render each distinct coordinate set once, in parallel using Rayon
+    let (unique, slots) = dedup_coord_sets(&config.coord_sets);
+    let rendered: Vec<SweepPoint> = unique
         .par_iter()
-        .map(|coords| render_single_point(config, coords, font_loader, options))
-        .collect();
+        .map(|&index| render_single_point(config, &config.coord_sets[index], font_loader, options))
+        .collect::<Result<_>>()?;
 
-    results
+    Ok(slots
+        .iter()
+        .enumerate()
+        .map(|(index, &slot)| expand_point(&rendered[slot], index == unique[slot]))
+        .collect())
 }
 
 /// Render the same glyph at multiple variation coordinates with fallback.
@@ -131,13 +138,65 @@ pub fn render_variation_sweep_with_fallback(
     font_loader: &FontLoader,
     options: &ExecutionOptions,
 ) -> Vec<Option<SweepPoint>> {
-    config
-        .coord_sets
+    let (unique, slots) = dedup_coord_sets(&config.coord_sets);
+    let rendered: Vec<Option<SweepPoint>> = unique
         .par_iter()
-        .map(|coords| render_single_point(config, coords, font_loader, options).ok())
+        .map(|&index| {
+            render_single_point(config, &config.coord_sets[index], font_loader, options).ok()
+        })
+        .collect();
+
+    slots
+        .iter()
+        .enumerate()
+        .map(|(index, &slot)| {
+            rendered[slot]
+                .as_ref()
+                .map(|point| expand_point(point, index == unique[slot]))
+        })
         .collect()
 }
 
+/// Copy a rendered point to one of the input positions it answers.
+///
+/// Repeats of a coordinate set were never rendered, so they report no render
+/// time instead of the first occurrence's.
+fn expand_point(point: &SweepPoint, first_occurrence: bool) -> SweepPoint {
+    let mut point = point.clone();
+    if !first_occurrence {
+        point.render_ms = 0.0;
+    }
+    point
+}
+
+/// Group identical coordinate sets so each distinct location renders once.
+///
+/// Returns the index of the first occurrence of every distinct set, plus,
+/// for each input set, the position of its representative in that list.
+/// Optimizer loops revisit locations often (grid snapping, restarts), and a
+/// duplicate would otherwise repeat the full shape/render/metrics work.
+fn dedup_coord_sets(coord_sets: &[VariationCoords]) -> (Vec<usize>, Vec<usize>) {
+    let mut seen: HashMap<Vec<(&str, u32)>, usize> = HashMap::with_capacity(coord_sets.len());
+    let mut unique = Vec::with_capacity(coord_sets.len());
+    let slots = coord_sets
+        .iter()
+        .enumerate()
+        .map(|(index, coords)| {
+            // Sorted by axis tag: HashMap iteration order is not canonical
+            let mut key: Vec<(&str, u32)> = coords
+                .iter()
+                .map(|(axis, value)| (axis.as_str(), value.to_bits()))
+                .collect();
+            key.sort_unstable();
+            *seen.entry(key).or_insert_with(|| {
+                unique.push(index);
+                unique.len() - 1
+            })
+        })
+        .collect();
+    (unique, slots)
+}
+
 /// Render a single point in the variation sweep.
 fn render_single_point(
     config: &SweepConfig,
@@ -258,6 +317,48 @@ mod tests {
         }
     }
 
+    #[test]
+    fn dedup_coord_sets_ignores_axis_order() {
+        let a: VariationCoords = [("wght".to_string(), 500.0), ("wdth".to_string(), 100.0)]
+            .into_iter()
+            .collect();
+        let b: VariationCoords = [("wdth".to_string(), 100.0), ("wght".to_string(), 500.0)]
+            .into_iter()
+            .collect();
+        let c: VariationCoords = [("wght".to_string(), 700.0)].into_iter().collect();
+
+        let (unique, slots) = dedup_coord_sets(&[a, c.clone(), b, c]);
+        assert_eq!(unique, vec![0, 1]);
+        assert_eq!(slots, vec![0, 1, 0, 1]);
+    }
+
+    #[test]
+    fn sweep_repeated_coordinates_share_results() {
+        let mut coords = HashMap::new();
+        coords.insert("wght".to_string(), 600.0);
+
+        let config = SweepConfig {
+            font_path: "testdata/fonts/Arial-Black.ttf".to_string(),
+            font_size: 256,
+            text: "A".to_string(),
+            width: 64,
+            height: 64,
+            coord_sets: vec![coords.clone(), HashMap::new(), coords.clone()],
+        };
+
+        let font_loader = FontLoader::new(512);
+        let options = ExecutionOptions::new(None, None);
+        let results = render_variation_sweep(&config, &font_loader, &options).unwrap();
+
+        assert_eq!(results.len(), 3);
+        assert_eq!(results[0].coords, coords);
+        assert!(results[1].coords.is_empty());
+        assert_eq!(results[2].coords, coords);
+        assert_eq!(results[0].metrics.density, results[2].metrics.density);
+        assert!(results[0].render_ms > 0.0);
+        assert_eq!(results[2].render_ms, 0.0);
+    }
+
     #[test]
     fn sweep_with_fallback_handles_errors() {
         let mut coord_sets = vec![];
@@ -132,6 +132,41 @@ fn streaming_stats_reports_processed_and_errors() {
     assert_eq!(stats["errors"], 1);
 }
 
+#[test]
+fn streaming_burst_answers_every_line_in_order() {
+    let font_path = fixture_font();
+    let payload: String = (0..16)
+        .map(|idx| {
+            let job = json!({
+                "id": format!("burst-{idx}"),
+                "font": {"path": font_path, "size": 128, "variations": {}},
+                "text": {"content": "A"},
+                "rendering": {"format": "metrics", "encoding": "json", "width": 32, "height": 32}
+            });
+            format!("{job}\n")
+        })
+        .collect();
+
+    let output = assert_cmd::cargo::cargo_bin_cmd!("haforu")
+        .arg("stream")
+        .write_stdin(payload)
+        .output()
+        .expect("command should run");
+    assert!(output.status.success(), "stream should succeed: {output:?}");
+
+    let stdout = String::from_utf8(output.stdout).expect("stdout utf8");
+    let ids: Vec<String> = stdout
+        .lines()
+        .map(|line| {
+            let result: Value = serde_json::from_str(line).expect("valid result json");
+            assert_eq!(result["status"], "success");
+            result["id"].as_str().unwrap().to_string()
+        })
+        .collect();
+    let expected: Vec<String> = (0..16).map(|idx| format!("burst-{idx}")).collect();
+    assert_eq!(ids, expected);
+}
+
 #[test]
 fn diagnostics_command_outputs_json_report() {
     let output = assert_cmd::cargo::cargo_bin_cmd!("haforu")